@@ -0,0 +1,123 @@
+"""Compare near-duplicate verification kernels used by dedupe.
+
+Run from the repository root:
+
+    python benchmarks/bench_dedupe.py --records 2000 --candidates 500
+    python benchmarks/bench_dedupe.py --records 5000 --vocab 200000
+
+The rapidfuzz reference kernel is timed when ``pip install -e .[bench]`` provides it.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sandcastle.processor.similarity import encode, find_similar, jaccard  # noqa: E402
+from sandcastle.processor.dedupe import (  # noqa: E402
+    _jaccard_similarity,
+    _text_signature,
+    dedupe_records,
+    normalize_records,
+)
+
+RAPIDFUZZ_JACCARD = None
+if importlib.util.find_spec("rapidfuzz") and importlib.util.find_spec("rapidfuzz.distance.Jaccard"):
+    from rapidfuzz.distance import Jaccard as RAPIDFUZZ_JACCARD
+
+
+def synthetic_records(count: int, vocab_size: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    vocab = [f"word{idx}" for idx in range(vocab_size)]
+    records = []
+    for idx in range(count):
+        records.append(
+            {
+                "query": f"q{idx % 50}",
+                "engine": "searxng",
+                "rank": idx % 10 + 1,
+                "url": f"https://example{idx % 97}.com/page/{idx}",
+                "title": " ".join(rng.choices(vocab, k=6)),
+                "snippet": " ".join(rng.choices(vocab, k=20)),
+                "timestamp": "2026-02-06T10:30:00Z",
+            }
+        )
+    return records
+
+
+def timed(label: str, func, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - started) / repeat
+    print(f"{label:<40} {elapsed * 1000:10.3f} ms")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--candidates", type=int, default=500)
+    parser.add_argument("--vocab", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    records = synthetic_records(args.records, args.vocab, args.seed)
+    signatures = [_text_signature(record["title"], record["snippet"]) for record in records]
+    query, candidates = signatures[0], signatures[1 : args.candidates + 1]
+    print(f"Verify 1 record against {len(candidates)} candidates:")
+
+    # The original loop rebuilt each candidate's token list before every comparison.
+    candidate_texts = [
+        (record["title"], record["snippet"]) for record in records[1 : args.candidates + 1]
+    ]
+    timed(
+        "_jaccard_similarity (re-tokenized)",
+        lambda: [_jaccard_similarity(query, _text_signature(*text)) for text in candidate_texts],
+        args.repeat,
+    )
+    timed(
+        "_jaccard_similarity (cached tokens)",
+        lambda: [_jaccard_similarity(query, other) for other in candidates],
+        args.repeat,
+    )
+    if RAPIDFUZZ_JACCARD:
+        timed(
+            "RAPIDFUZZ_JACCARD",
+            lambda: [RAPIDFUZZ_JACCARD.similarity(query, other) for other in candidates],
+            args.repeat,
+        )
+    else:
+        print(f"{'RAPIDFUZZ_JACCARD':<40} {'unavailable':>13}")
+
+    query_signature = encode(query)
+    candidate_signatures = [encode(other) for other in candidates]
+    timed(
+        "jaccard (cached token sets)",
+        lambda: [jaccard(query_signature, other) for other in candidate_signatures],
+        args.repeat,
+    )
+    timed(
+        "find_similar (no prefilter)",
+        lambda: find_similar(query_signature, candidate_signatures, 0.85, prefilter=False),
+        args.repeat,
+    )
+    timed(
+        "find_similar (hashed prefilter)",
+        lambda: find_similar(query_signature, candidate_signatures, 0.85),
+        args.repeat,
+    )
+
+    print(f"\nEnd-to-end dedupe_records on {len(records)} records:")
+    normalized = normalize_records(records)
+    timed("dedupe_records", lambda: dedupe_records(normalized, threshold=0.85), 1)
+
+
+if __name__ == "__main__":
+    main()
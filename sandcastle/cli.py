@@ -2,21 +2,50 @@ from __future__ import annotations
 
 import json
 import os
+import socket
+import time
 from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 import click
 
 from sandcastle.collectors import brave, ddg, searxng
-from sandcastle.config import load_config, load_domains
-from sandcastle.models import ClusterSummary, ResearchQuestion, StrategyItem, TermsSummary
-from sandcastle.processor.clustering import build_clusters, load_keywords
-from sandcastle.processor.dedupe import dedupe_records, normalize_records
-from sandcastle.processor.filters import apply_domain_filters
+from sandcastle.collectors.hedging import Hedger
+from sandcastle.collectors.paging import fetch_pages
+from sandcastle.compact import CompactWriter, expand_records
+from sandcastle.config import (
+    DEFAULT_CONFIG_PATH,
+    DOMAINS_CONFIG_PATH,
+    Config,
+    load_config,
+    load_domains,
+)
+from sandcastle.frontier import Frontier, SqliteFrontier
+from sandcastle.models import ResearchQuestion, StrategyItem
+from sandcastle.manifest import Manifest, source_digests, sources_unchanged, stage_digest
+from sandcastle.pipeline import (
+    DEDUPE_CACHE_FILE,
+    cluster_stage,
+    dedupe_stage,
+    output_files,
+    process_records,
+    recluster_stage,
+    write_index,
+    write_json,
+    write_outputs,
+)
+from sandcastle.processor.clustering import load_keywords
+from sandcastle.processor.dedupe import normalize_records
+from sandcastle.processor.index import InvertedIndex
+from sandcastle.processor.sampling import UrlHashSampler, estimate_count, occurrence_squares
 from sandcastle.processor.text import tokenize_text
-from sandcastle.processor.terms import aggregate_terms
+from sandcastle.reasoner.backends import BACKENDS, get_backend
+from sandcastle.reasoner.executor import ReasonCache, run_reasoning
+from sandcastle.server import PipelineState, make_server
 
 
 def utc_now() -> str:
@@ -28,12 +57,6 @@ def read_queries(path: Path) -> list[str]:
         return [line.strip() for line in handle if line.strip()]
 
 
-def write_json(path: Path, payload: object) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2, ensure_ascii=False)
-
-
 def append_jsonl(path: Path, payloads: Iterable[dict]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("a", encoding="utf-8") as handle:
@@ -41,6 +64,27 @@ def append_jsonl(path: Path, payloads: Iterable[dict]) -> None:
             handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
 
 
+def read_raw_records(paths: Iterable[Path]) -> Iterator[dict]:
+    for path in paths:
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                yield json.loads(line)
+
+
+def read_records(paths: Iterable[Path]) -> Iterator[dict]:
+    """Read collector records, resolving references written by `collect --compact`."""
+    return expand_records(read_raw_records(paths))
+
+
+def open_compact_writer(path: Path) -> CompactWriter:
+    writer = CompactWriter()
+    if path.exists():
+        writer.observe(read_raw_records([path]))
+    return writer
+
+
 def load_anchor_terms(path: Path) -> list[str]:
     with path.open("r", encoding="utf-8") as handle:
         return [line.strip().lower() for line in handle if line.strip()]
@@ -59,24 +103,318 @@ def extract_phrases(texts: list[str], anchor_terms: list[str], max_followups: in
     return [phrase for phrase, _ in phrases[:max_followups]]
 
 
+def searx_urls(config: Config) -> list[str]:
+    """The primary SearXNG instance followed by its mirrors; hedging needs at least one mirror."""
+    return [os.getenv("SEARX_URL", config.search.searx_url), *config.search.searx_mirrors]
+
+
+def query_deadline(config: Config, started: float) -> float | None:
+    deadline_s = config.search.query_deadline_s
+    return started + deadline_s if deadline_s is not None else None
+
+
+def request_timeout(config: Config, deadline: float | None) -> float:
+    """Per-request timeout, capped at the time left before ``deadline`` (a perf_counter value)."""
+    if deadline is None:
+        return config.search.timeout_s
+    remaining = deadline - time.perf_counter()
+    if remaining <= 0:
+        raise TimeoutError("query deadline passed")
+    return min(config.search.timeout_s, remaining)
+
+
+def fetch_engine(
+    engine: str,
+    query: str,
+    config: Config,
+    hedger: Hedger | None = None,
+    deadline: float | None = None,
+) -> list[dict] | None:
+    """Fetch results from one engine, reporting failures and returning None.
+
+    SearXNG page requests are hedged across ``searx_urls`` when ``hedger`` is given and
+    mirrors are configured. Every request, including a hedge launched later, times out
+    by ``deadline``, so abandoned calls do not outlive it.
+    """
+    pages = config.search.page_depth(engine)
+    try:
+        if engine == "searxng":
+            urls = searx_urls(config)
+
+            def fetch_searx(url: str, page: int) -> list[dict]:
+                return searxng.fetch(
+                    query,
+                    base_url=url,
+                    timeout_s=request_timeout(config, deadline),
+                    user_agent=config.search.user_agent,
+                    page=page,
+                )
+
+            def fetch_searx_page(page: int) -> list[dict]:
+                calls = [partial(fetch_searx, url, page) for url in urls]
+                return hedger.call(engine, calls) if hedger else calls[0]()
+
+            return fetch_pages(fetch_searx_page, pages, prefetch=config.search.prefetch_pages)
+        if engine == "brave":
+            return fetch_pages(
+                lambda page: brave.fetch(
+                    query,
+                    timeout_s=request_timeout(config, deadline),
+                    user_agent=config.search.user_agent,
+                    page=page,
+                ),
+                pages,
+                prefetch=config.search.prefetch_pages,
+            )
+        if engine == "ddg":
+            # duckduckgo-search pages internally, so depth maps to a result count.
+            return ddg.fetch(
+                query, max_results=10 * pages, timeout_s=request_timeout(config, deadline)
+            )
+        click.echo(f"Unknown engine: {engine}")
+        return None
+    except (brave.BraveDisabledError, ddg.DdgUnavailableError) as exc:
+        click.echo(f"Engine {engine} unavailable: {exc}")
+        return None
+    except Exception as exc:
+        click.echo(f"Engine {engine} error: {exc}")
+        return None
+
+
+def build_payloads(query: str, engine: str, results: list[dict]) -> list[dict]:
+    timestamp = utc_now()
+    return [
+        {
+            "query": query,
+            "engine": engine,
+            "rank": result["rank"],
+            "url": result["url"],
+            "title": result.get("title", ""),
+            "snippet": result.get("snippet", ""),
+            "timestamp": timestamp,
+            "raw_metadata": result.get("raw_metadata", {}),
+        }
+        for result in results
+    ]
+
+
+def fetch_query(
+    query: str,
+    engine_list: list[str],
+    config: Config,
+    hedger: Hedger,
+) -> dict[str, list[dict] | None]:
+    """Fetch every engine concurrently, dropping engines that miss the query deadline.
+
+    Each query gets its own pool, so engines abandoned at the deadline never hold slots
+    needed by later queries. Their request timeouts are capped at the deadline, which
+    also bounds how long the interpreter waits to join them at exit.
+    """
+    started = time.perf_counter()
+    deadline_s = config.search.query_deadline_s
+    deadline = query_deadline(config, started)
+    pool = ThreadPoolExecutor(max_workers=max(1, len(engine_list)))
+    futures = {
+        engine: pool.submit(fetch_engine, engine, query, config, hedger, deadline)
+        for engine in engine_list
+    }
+    done, _ = wait(futures.values(), timeout=deadline_s)
+    pool.shutdown(wait=False, cancel_futures=True)
+    results: dict[str, list[dict] | None] = {}
+    for engine, future in futures.items():
+        if future in done:
+            results[engine] = future.result()
+        else:
+            hedger.stats.add("deadline_misses")
+            click.echo(f"Engine {engine} missed the {deadline_s}s deadline")
+            results[engine] = None
+    hedger.stats.add("queries")
+    hedger.stats.query_latencies.append(time.perf_counter() - started)
+    return results
+
+
+def make_hedger(config: Config) -> Hedger:
+    return Hedger(config.search.hedge_percentile, min_samples=config.search.hedge_min_samples)
+
+
+def segment_path(out_path: Path, worker_id: str) -> Path:
+    return out_path.with_name(f"{out_path.stem}.{worker_id}{out_path.suffix}")
+
+
+def run_worker(
+    frontier: Frontier,
+    query_list: list[str],
+    engine_list: list[str],
+    out_path: Path,
+    config: Config,
+    anchor_terms: list[str] | None,
+    worker_id: str,
+    lease_s: float,
+    poll_s: float = 1.0,
+    compact: bool = False,
+) -> int:
+    """Process (query, engine) tasks from a shared frontier until it is drained.
+
+    Results go to a per-worker segment next to ``out_path`` and are written only after
+    the task is marked complete, so a task re-leased after its lease expired is never
+    written twice. Expansion follow-ups are pushed back to the frontier when
+    ``anchor_terms`` is given. Returns the number of tasks this worker completed.
+    """
+    frontier.add_queries(query_list, engine_list)
+    segment = segment_path(out_path, worker_id)
+    writer = open_compact_writer(segment) if compact else None
+    hedger = make_hedger(config)
+    completed = 0
+    while True:
+        task = frontier.lease(worker_id, lease_s)
+        if task is None:
+            if frontier.is_drained():
+                break
+            time.sleep(poll_s)
+            continue
+
+        started = time.perf_counter()
+        deadline = query_deadline(config, started)
+        results = fetch_engine(task.engine, task.query, config, hedger, deadline)
+        if deadline is not None and time.perf_counter() >= deadline:
+            hedger.stats.add("deadline_misses")
+            deadline_s = config.search.query_deadline_s
+            click.echo(f"Engine {task.engine} missed the {deadline_s}s deadline")
+            results = None
+        hedger.stats.add("queries")
+        hedger.stats.query_latencies.append(time.perf_counter() - started)
+        payloads = build_payloads(task.query, task.engine, results) if results else []
+        if not frontier.complete(task):
+            # Another worker holds the task now and will write its results.
+            click.echo(f"Lease lost for {task.engine}: {task.query}")
+            continue
+        completed += 1
+        append_jsonl(segment, writer.compact(payloads) if writer else payloads)
+        if anchor_terms is not None and payloads:
+            texts = [f"{payload['title']} {payload['snippet']}" for payload in payloads]
+            followups = extract_phrases(texts, anchor_terms, config.expansion.max_followups)
+            frontier.add_queries(
+                followups, engine_list, max_pending=config.expansion.max_queue_size
+            )
+    hedger.close()
+    click.echo(f"Worker {worker_id} completed {completed} tasks into {segment}")
+    click.echo(f"Run stats: {hedger.stats.summary()}")
+    return completed
+
+
+def run_sample_preview(
+    inputs: list[Path],
+    out_path: Path,
+    config_file: Path,
+    domains_file: Path,
+    keywords_path: Path,
+    rate: float,
+    seed: int,
+) -> None:
+    """Run the full pipeline on a seeded sample and write approximate full-corpus estimates."""
+    config = load_config(config_file)
+    sampler = UrlHashSampler(rate, seed=seed)
+    normalized = normalize_records(sampler.sample(read_records(inputs)))
+    domains = load_domains(domains_file)
+    outputs = process_records(normalized, config, domains, load_keywords(keywords_path))
+    write_outputs(outputs, out_path)
+
+    term_squares, bigram_squares = occurrence_squares(outputs.deduped)
+    report = sampler.report()
+    report["clusters"] = {
+        cluster["cluster_id"]: estimate_count(cluster["count"], rate)
+        for cluster in outputs.clusters
+    }
+    report["terms"] = {
+        term: estimate_count(count, rate, term_squares[term])
+        for term, count in outputs.terms["global_top_terms"]
+    }
+    report["bigrams"] = {
+        pair: estimate_count(count, rate, bigram_squares[pair])
+        for pair, count in outputs.terms["global_top_bigrams"]
+    }
+    write_json(out_path / "sample_report.json", report)
+
+    sampled = f"{report['records_sampled']} of {report['records_seen']}"
+    click.echo(f"Sampled {sampled} records into {out_path} (approximate estimates)")
+    largest = sorted(report["clusters"].items(), key=lambda item: (-item[1]["sample"], item[0]))
+    for cluster_id, estimate in largest[:10]:
+        click.echo(f"  {cluster_id}: ~{estimate['estimate']} ± {estimate['ci95']}")
+
+
 @click.group()
 def main() -> None:
     """Sandcastle pipeline CLI."""
 
 
 @main.command()
-@click.option("--queries", "queries_path", type=click.Path(exists=True, dir_okay=False), required=True)
+@click.option(
+    "--queries", "queries_path", type=click.Path(exists=True, dir_okay=False), required=True
+)
 @click.option("--engines", default="searxng", help="Comma-separated engines")
 @click.option("--out", "out_path", type=click.Path(dir_okay=False), required=True)
 @click.option("--expand", is_flag=True, default=False)
 @click.option("--config", "config_path", type=click.Path(exists=True, dir_okay=False), default=None)
-@click.option("--anchor-terms", "anchor_terms_path", type=click.Path(exists=True, dir_okay=False), default="config/anchor_terms.txt")
-def collect(queries_path: str, engines: str, out_path: str, expand: bool, config_path: str | None, anchor_terms_path: str) -> None:
+@click.option(
+    "--anchor-terms",
+    "anchor_terms_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default="config/anchor_terms.txt",
+)
+@click.option("--worker", is_flag=True, default=False, help="Pull queries from a shared frontier")
+@click.option(
+    "--frontier", "frontier_path", type=click.Path(dir_okay=False), default="data/frontier.sqlite"
+)
+@click.option(
+    "--worker-id", default=None, help="Worker name used for leases and the output segment"
+)
+@click.option(
+    "--lease-s",
+    type=click.FloatRange(min=1),
+    default=300.0,
+    help="Seconds before an unfinished task is retried",
+)
+@click.option(
+    "--compact",
+    is_flag=True,
+    default=False,
+    help="Write repeated canonical URLs as compact references",
+)
+def collect(
+    queries_path: str,
+    engines: str,
+    out_path: str,
+    expand: bool,
+    config_path: str | None,
+    anchor_terms_path: str,
+    worker: bool,
+    frontier_path: str,
+    worker_id: str | None,
+    lease_s: float,
+    compact: bool,
+) -> None:
     """Collect raw search results into append-only JSONL."""
     config = load_config(Path(config_path) if config_path else None)
     query_list = read_queries(Path(queries_path))
     engine_list = [engine.strip().lower() for engine in engines.split(",") if engine.strip()]
 
+    if worker:
+        run_worker(
+            SqliteFrontier(Path(frontier_path)),
+            query_list,
+            engine_list,
+            Path(out_path),
+            config,
+            load_anchor_terms(Path(anchor_terms_path)) if expand else None,
+            worker_id or f"{socket.gethostname()}-{os.getpid()}",
+            lease_s,
+            compact=compact,
+        )
+        return
+
+    writer = open_compact_writer(Path(out_path)) if compact else None
+    hedger = make_hedger(config)
+
     queue = deque(query_list)
     seen_queries = set(query_list)
     queries_all_path = Path("data/queries_all.txt")
@@ -94,50 +432,14 @@ def collect(queries_path: str, engines: str, out_path: str, expand: bool, config
                 handle.write(query + "\n")
 
         batch_texts: list[str] = []
+        fetched = fetch_query(query, engine_list, config, hedger)
         for engine in engine_list:
-            try:
-                if engine == "searxng":
-                    results = searxng.fetch(
-                        query,
-                        base_url=os.getenv("SEARX_URL", config.search.searx_url),
-                        timeout_s=config.search.timeout_s,
-                        user_agent=config.search.user_agent,
-                    )
-                elif engine == "brave":
-                    results = brave.fetch(
-                        query,
-                        timeout_s=config.search.timeout_s,
-                        user_agent=config.search.user_agent,
-                    )
-                elif engine == "ddg":
-                    results = ddg.fetch(query)
-                else:
-                    click.echo(f"Unknown engine: {engine}")
-                    continue
-            except (brave.BraveDisabledError, ddg.DdgUnavailableError) as exc:
-                click.echo(f"Engine {engine} unavailable: {exc}")
+            results = fetched[engine]
+            if results is None:
                 continue
-            except Exception as exc:
-                click.echo(f"Engine {engine} error: {exc}")
-                continue
-
-            timestamp = utc_now()
-            payloads = []
-            for result in results:
-                batch_texts.append(f"{result.get('title', '')} {result.get('snippet', '')}")
-                payloads.append(
-                    {
-                        "query": query,
-                        "engine": engine,
-                        "rank": result["rank"],
-                        "url": result["url"],
-                        "title": result.get("title", ""),
-                        "snippet": result.get("snippet", ""),
-                        "timestamp": timestamp,
-                        "raw_metadata": result.get("raw_metadata", {}),
-                    }
-                )
-            append_jsonl(Path(out_path), payloads)
+            payloads = build_payloads(query, engine, results)
+            batch_texts.extend(f"{payload['title']} {payload['snippet']}" for payload in payloads)
+            append_jsonl(Path(out_path), writer.compact(payloads) if writer else payloads)
 
         if expand and batch_texts:
             followups = extract_phrases(batch_texts, anchor_terms, config.expansion.max_followups)
@@ -151,78 +453,311 @@ def collect(queries_path: str, engines: str, out_path: str, expand: bool, config
                 with queries_all_path.open("a", encoding="utf-8") as handle:
                     handle.write(phrase + "\n")
 
+    hedger.close()
+    click.echo(f"Run stats: {hedger.stats.summary()}")
+
 
 @main.command()
-@click.option("--in", "input_path", type=click.Path(exists=True, dir_okay=False), required=True)
+@click.option(
+    "--in",
+    "input_paths",
+    type=click.Path(exists=True, dir_okay=False),
+    multiple=True,
+    required=True,
+    help="Collector JSONL file; repeat to read several worker segments",
+)
 @click.option("--outdir", "out_dir", type=click.Path(file_okay=False), required=True)
-@click.option("--keywords", "keywords_path", type=click.Path(exists=True, dir_okay=False), default="config/keywords.txt")
+@click.option(
+    "--keywords",
+    "keywords_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default="config/keywords.txt",
+)
 @click.option("--config", "config_path", type=click.Path(exists=True, dir_okay=False), default=None)
-@click.option("--domains", "domains_path", type=click.Path(exists=True, dir_okay=False), default=None)
-def process(input_path: str, out_dir: str, keywords_path: str, config_path: str | None, domains_path: str | None) -> None:
+@click.option(
+    "--domains", "domains_path", type=click.Path(exists=True, dir_okay=False), default=None
+)
+@click.option(
+    "--index", "build_search_index", is_flag=True, default=False, help="Also build the search index"
+)
+@click.option("--force", is_flag=True, default=False, help="Recompute even if inputs are unchanged")
+@click.option(
+    "--sample",
+    "sample_rate",
+    type=click.FloatRange(min=0, max=1, min_open=True),
+    default=None,
+    help="Preview on a sampled fraction of canonical URLs",
+)
+@click.option("--seed", type=int, default=0, help="Seed for --sample")
+def process(
+    input_paths: tuple[str, ...],
+    out_dir: str,
+    keywords_path: str,
+    config_path: str | None,
+    domains_path: str | None,
+    build_search_index: bool,
+    force: bool,
+    sample_rate: float | None,
+    seed: int,
+) -> None:
     """Process raw JSONL into deduped outputs and clusters."""
-    config = load_config(Path(config_path) if config_path else None)
-    domains = load_domains(Path(domains_path) if domains_path else None)
+    config_file = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
+    domains_file = Path(domains_path) if domains_path else DOMAINS_CONFIG_PATH
+    inputs = [Path(path) for path in input_paths]
+    out_path = Path(out_dir)
+    if sample_rate is not None:
+        run_sample_preview(
+            inputs,
+            out_path / "sample",
+            config_file,
+            domains_file,
+            Path(keywords_path),
+            sample_rate,
+            seed,
+        )
+        return
+    manifest = Manifest(out_path)
+
+    process_digest = stage_digest(
+        [*inputs, config_file, domains_file, Path(keywords_path)],
+        {"index": build_search_index},
+    )
+    if not force and manifest.is_fresh("process", process_digest):
+        click.echo("Stages reused: dedupe, process")
+        return
+
+    config = load_config(config_file)
+    domains = load_domains(domains_file)
+    keywords = load_keywords(Path(keywords_path))
 
-    records: list[dict] = []
-    with Path(input_path).open("r", encoding="utf-8") as handle:
-        for line in handle:
-            if not line.strip():
-                continue
-            records.append(json.loads(line))
-
-    normalized = normalize_records(records)
-    deduped = dedupe_records(normalized, threshold=config.dedupe.similarity_threshold)
-
-    deduped_payloads: list[dict] = []
-    for item in deduped:
-        deduped_payloads.append(
-            {
-                "id": item.id,
-                "canonical_url": item.canonical_url,
-                "title": item.title,
-                "snippet": item.snippet,
-                "engines": item.engines,
-                "best_rank": item.best_rank,
-                "cluster_ids": [],
-                "timestamp": item.timestamp,
-            }
+    dedupe_digest = stage_digest(
+        inputs, {"similarity_threshold": config.dedupe.similarity_threshold}
+    )
+    if not force and manifest.is_fresh("dedupe", dedupe_digest):
+        deduped = json.loads((out_path / DEDUPE_CACHE_FILE).read_text(encoding="utf-8"))
+        reused = ["dedupe"]
+    else:
+        deduped = dedupe_stage(normalize_records(read_records(inputs)), config)
+        write_json(out_path / DEDUPE_CACHE_FILE, deduped)
+        manifest.record("dedupe", dedupe_digest, [DEDUPE_CACHE_FILE])
+        reused = []
+
+    outputs = cluster_stage(deduped, config, domains, keywords)
+    write_outputs(outputs, out_path, build_search_index=build_search_index)
+    manifest.record(
+        "process",
+        process_digest,
+        output_files(build_search_index),
+        inputs=[str(path) for path in inputs],
+        config=str(config_file),
+        domains=str(domains_file),
+        sources=source_digests([*inputs, config_file, domains_file]),
+        keywords=keywords,
+        index=build_search_index,
+    )
+    manifest.save()
+    click.echo(f"Stages reused: {', '.join(reused) or 'none'}")
+
+
+@main.command()
+@click.option("--outdir", "out_dir", type=click.Path(exists=True, file_okay=False), required=True)
+@click.option(
+    "--keywords",
+    "keywords_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default="config/keywords.txt",
+)
+def recluster(out_dir: str, keywords_path: str) -> None:
+    """Update clusters for an edited keyword list without rerunning dedupe."""
+    out_path = Path(out_dir)
+    manifest = Manifest(out_path)
+    previous = manifest.stages.get("process")
+    if previous is None or "keywords" not in previous:
+        raise click.ClickException(
+            f"No processed outputs recorded in {out_dir}; run `sandcastle process` first"
+        )
+    if not sources_unchanged(previous.get("sources", {})):
+        raise click.ClickException(
+            f"Inputs, config or domains changed since {out_dir} was processed; "
+            "run `sandcastle process` instead"
         )
 
-    filtered = apply_domain_filters(deduped_payloads, domains)
+    config_file = Path(previous["config"])
+    domains_file = Path(previous["domains"])
+    config = load_config(config_file)
     keywords = load_keywords(Path(keywords_path))
-    clusters = build_clusters(filtered, keywords)
-    terms = aggregate_terms(filtered)
+    deduped = json.loads((out_path / "deduped.json").read_text(encoding="utf-8"))
+    clusters = json.loads((out_path / "clusters.json").read_text(encoding="utf-8"))
+    clusters = recluster_stage(deduped, clusters, previous["keywords"], keywords, config)
+
+    write_json(out_path / "deduped.json", deduped)
+    write_json(out_path / "clusters.json", clusters)
+    if previous.get("index"):
+        write_index(deduped, out_path / "index")
+    inputs = [Path(path) for path in previous["inputs"]]
+    manifest.record(
+        "process",
+        stage_digest(
+            [*inputs, config_file, domains_file, Path(keywords_path)], {"index": previous["index"]}
+        ),
+        previous["outputs"],
+        inputs=previous["inputs"],
+        config=previous["config"],
+        domains=previous["domains"],
+        sources=previous["sources"],
+        keywords=keywords,
+        index=previous["index"],
+    )
+    manifest.save()
+    added = len(set(keywords) - set(previous["keywords"]))
+    removed = len(set(previous["keywords"]) - set(keywords))
+    click.echo(f"Reclustered: {added} keywords added, {removed} removed, {len(clusters)} clusters")
 
-    out_path = Path(out_dir)
-    write_json(out_path / "deduped.json", filtered)
-    write_json(out_path / "clusters.json", [ClusterSummary(**cluster.__dict__).model_dump() for cluster in clusters])
-    write_json(out_path / "terms.json", TermsSummary(**terms).model_dump())
+
+@main.command()
+@click.argument("query")
+@click.option("--indir", "in_dir", type=click.Path(exists=True, file_okay=False), required=True)
+@click.option(
+    "--cluster", "cluster_ids", multiple=True, help="Only return members of these clusters"
+)
+@click.option("--limit", type=click.IntRange(min=1), default=20)
+def search(query: str, in_dir: str, cluster_ids: tuple[str, ...], limit: int) -> None:
+    """Search processed items using the index built by `process --index`."""
+    index_path = Path(in_dir) / "index"
+    if not index_path.is_dir():
+        raise click.ClickException(
+            f"No index found in {in_dir}; run `sandcastle process --index` first"
+        )
+    index = InvertedIndex(index_path)
+    try:
+        doc_ids = index.search(query)
+    except ValueError as exc:
+        raise click.ClickException(f"Invalid query: {exc}") from exc
+    for cluster_id in cluster_ids:
+        members = index.cluster_docs(cluster_id)
+        doc_ids = [doc_id for doc_id in doc_ids if doc_id in members]
+    click.echo(f"{len(doc_ids)} matches")
+    for doc_id in doc_ids[:limit]:
+        doc = index.doc(doc_id)
+        click.echo(f"{doc['id']}\t{doc['canonical_url']}\t{doc['title']}")
 
 
 @main.command()
 @click.option("--indir", "in_dir", type=click.Path(exists=True, file_okay=False), required=True)
 @click.option("--outdir", "out_dir", type=click.Path(file_okay=False), required=True)
-def reason(in_dir: str, out_dir: str) -> None:
-    """Reasoning stub that writes placeholder outputs."""
+@click.option("--backend", "backend_name", type=click.Choice(sorted(BACKENDS)), default="stub")
+@click.option("--workers", type=click.IntRange(min=1), default=4, help="Concurrent backend calls")
+@click.option(
+    "--batch-size", type=click.IntRange(min=1), default=8, help="Clusters per backend call"
+)
+@click.option(
+    "--cache/--no-cache", "use_cache", default=True, help="Reuse results for unchanged clusters"
+)
+@click.option("--force", is_flag=True, default=False, help="Recompute even if inputs are unchanged")
+def reason(
+    in_dir: str,
+    out_dir: str,
+    backend_name: str,
+    workers: int,
+    batch_size: int,
+    use_cache: bool,
+    force: bool,
+) -> None:
+    """Reason over clusters with a pluggable backend."""
     in_path = Path(in_dir)
     out_path = Path(out_dir)
+    manifest = Manifest(out_path)
+    reason_digest = stage_digest([in_path / "clusters.json"], {"backend": backend_name})
+    if not force and manifest.is_fresh("reason", reason_digest):
+        click.echo("Stages reused: reason")
+        return
+
     clusters = json.loads((in_path / "clusters.json").read_text(encoding="utf-8"))
+    backend = get_backend(backend_name)
+    cache = ReasonCache(out_path / "reason_cache.json") if use_cache else None
+    results, stats = run_reasoning(
+        clusters, backend, cache=cache, max_workers=workers, batch_size=batch_size
+    )
+
     strategy = [
-        StrategyItem(cluster_id=cluster["cluster_id"], recommendation="TODO: analyze with LLM", priority=0).model_dump()
-        for cluster in clusters
+        StrategyItem(
+            cluster_id=result.cluster_id,
+            recommendation=result.recommendation,
+            priority=result.priority,
+        ).model_dump()
+        for result in results
     ]
     questions = [
         ResearchQuestion(
-            question="TODO: generate with LLM",
-            related_clusters=[cluster["cluster_id"]],
-            status="pending",
+            question=question, related_clusters=[result.cluster_id], status="pending"
         ).model_dump()
-        for cluster in clusters
+        for result in results
+        for question in result.questions
     ]
 
     out_path.mkdir(parents=True, exist_ok=True)
     write_json(out_path / "strategy.json", strategy)
     write_json(out_path / "research_questions.json", questions)
+    manifest.record("reason", reason_digest, ["strategy.json", "research_questions.json"])
+    manifest.save()
+    click.echo(
+        f"Reasoned {stats.clusters} clusters ({stats.cached} cached, {stats.batches} backend calls)"
+    )
+
+
+@main.command()
+@click.option("--host", default="127.0.0.1")
+@click.option("--port", type=int, default=8765)
+@click.option(
+    "--in",
+    "input_paths",
+    type=click.Path(exists=True, dir_okay=False),
+    multiple=True,
+    help="Collector JSONL to preload",
+)
+@click.option(
+    "--outdir",
+    "out_dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Where POST /process writes outputs",
+)
+@click.option(
+    "--keywords",
+    "keywords_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default="config/keywords.txt",
+)
+@click.option("--config", "config_path", type=click.Path(exists=True, dir_okay=False), default=None)
+@click.option(
+    "--domains", "domains_path", type=click.Path(exists=True, dir_okay=False), default=None
+)
+def serve(
+    host: str,
+    port: int,
+    input_paths: tuple[str, ...],
+    out_dir: str | None,
+    keywords_path: str,
+    config_path: str | None,
+    domains_path: str | None,
+) -> None:
+    """Run a local HTTP daemon that keeps pipeline state warm in memory."""
+    state = PipelineState(
+        Path(config_path) if config_path else None,
+        Path(domains_path) if domains_path else None,
+        Path(keywords_path),
+        out_path=Path(out_dir) if out_dir else None,
+    )
+    state.add_records(read_records(Path(path) for path in input_paths))
+    server = make_server(state, host=host, port=port)
+    loaded = state.counters["records"]
+    click.echo(f"Serving on http://{host}:{server.server_address[1]} ({loaded} records loaded)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
 
 
 if __name__ == "__main__":
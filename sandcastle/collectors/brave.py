@@ -9,7 +9,7 @@ class BraveDisabledError(RuntimeError):
     pass
 
 
-def fetch(query: str, timeout_s: int, user_agent: str) -> list[dict]:
+def fetch(query: str, timeout_s: float, user_agent: str, page: int = 1) -> list[dict]:
     api_key = os.getenv("BRAVE_API_KEY")
     if not api_key:
         raise BraveDisabledError("BRAVE_API_KEY not set")
@@ -20,6 +20,9 @@ def fetch(query: str, timeout_s: int, user_agent: str) -> list[dict]:
         "X-Subscription-Token": api_key,
     }
     params = {"q": query}
+    if page > 1:
+        # Brave's offset counts pages, not results.
+        params["offset"] = page - 1
     response = requests.get(url, params=params, headers=headers, timeout=timeout_s)
     response.raise_for_status()
     payload = response.json()
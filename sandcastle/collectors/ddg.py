@@ -5,15 +5,15 @@ class DdgUnavailableError(RuntimeError):
     pass
 
 
-def fetch(query: str) -> list[dict]:
+def fetch(query: str, max_results: int = 10, timeout_s: float = 10) -> list[dict]:
     try:
         from duckduckgo_search import DDGS
     except ImportError as exc:
         raise DdgUnavailableError("duckduckgo-search not installed") from exc
 
     results = []
-    with DDGS() as ddgs:
-        for idx, item in enumerate(ddgs.text(query, max_results=10), start=1):
+    with DDGS(timeout=timeout_s) as ddgs:
+        for idx, item in enumerate(ddgs.text(query, max_results=max_results), start=1):
             results.append(
                 {
                     "rank": idx,
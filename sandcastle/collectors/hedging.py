@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+class LatencyTracker:
+    """Sliding window of recent request latencies per key."""
+
+    def __init__(self, window: int = 200) -> None:
+        self._samples: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float) -> None:
+        with self._lock:
+            self._samples[key].append(seconds)
+
+    def percentile(self, key: str, pct: float, min_samples: int) -> float | None:
+        with self._lock:
+            samples = list(self._samples[key])
+        if len(samples) < min_samples:
+            return None
+        return percentile(samples, pct)
+
+
+@dataclass
+class RunStats:
+    queries: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    deadline_misses: int = 0
+    query_latencies: list[float] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def summary(self) -> str:
+        line = (
+            f"{self.queries} queries, {self.hedges} hedges ({self.hedge_wins} won), "
+            f"{self.deadline_misses} engine deadline misses"
+        )
+        if self.query_latencies:
+            line += (
+                f", query latency p50 {percentile(self.query_latencies, 50):.2f}s"
+                f" p99 {percentile(self.query_latencies, 99):.2f}s"
+            )
+        return line
+
+
+class Hedger:
+    """Issues a backup request when the primary is slower than a latency percentile.
+
+    With ``hedge_percentile`` unset, calls run directly with no hedging.
+    """
+
+    def __init__(
+        self, hedge_percentile: float | None, min_samples: int = 10, max_workers: int = 16
+    ) -> None:
+        if hedge_percentile is not None and not 0 < hedge_percentile <= 100:
+            raise ValueError("hedge_percentile must be in (0, 100]")
+        self.hedge_percentile = hedge_percentile
+        self.min_samples = min_samples
+        self.tracker = LatencyTracker()
+        self.stats = RunStats()
+        self._pool = (
+            ThreadPoolExecutor(max_workers=max_workers) if hedge_percentile is not None else None
+        )
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _timed(self, key: str, call: Callable[[], T]) -> T:
+        started = time.perf_counter()
+        result = call()
+        self.tracker.record(key, time.perf_counter() - started)
+        return result
+
+    def call(self, key: str, calls: list[Callable[[], T]]) -> T:
+        """Run ``calls[0]``, launching the next call if it is slow or fails.
+
+        Returns the first successful result and raises the last error if every call fails.
+        """
+        if self._pool is None or len(calls) < 2:
+            return self._timed(key, calls[0])
+
+        delay = self.tracker.percentile(key, self.hedge_percentile, self.min_samples)
+        pending: dict[Future, int] = {self._pool.submit(self._timed, key, calls[0]): 0}
+        launched = 1
+        last_error: Exception = RuntimeError("no calls completed")
+        while pending:
+            timeout = delay if launched < len(calls) else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                pending[self._pool.submit(self._timed, key, calls[launched])] = launched
+                launched += 1
+                self.stats.add("hedges")
+                continue
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    last_error = exc
+                    continue
+                if index > 0:
+                    self.stats.add("hedge_wins")
+                for other in pending:
+                    other.cancel()
+                return result
+            if launched < len(calls):
+                pending[self._pool.submit(self._timed, key, calls[launched])] = launched
+                launched += 1
+                self.stats.add("hedges")
+        raise last_error
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from sandcastle.processor.canonicalize import canonicalize_url
+
+
+def _append_new(page_results: list[dict], results: list[dict], seen: set[str]) -> bool:
+    """Append a page with global ranks; False if it is empty or only repeats seen URLs."""
+    canonical = {canonicalize_url(result["url"]) for result in page_results}
+    if not canonical or canonical <= seen:
+        return False
+    seen |= canonical
+    for result in page_results:
+        results.append({**result, "rank": len(results) + 1})
+    return True
+
+
+def fetch_pages(
+    fetch_page: Callable[[int], list[dict]], pages: int, prefetch: int = 3
+) -> list[dict]:
+    """Fetch up to ``pages`` result pages with up to ``prefetch`` requests in flight.
+
+    Pages are consumed in order and ranks are renumbered across pages. Fetching stops at
+    the first page that is empty, fails, or only repeats canonical URLs already seen.
+    An error on the first page propagates. The first page is fetched alone, and deeper
+    pages are only prefetched once it has shown new URLs. When fetching stops early,
+    ``cancel()`` only drops prefetched pages that have not started; requests already in
+    flight still run to completion before this returns.
+    """
+    if pages <= 1:
+        return fetch_page(1)
+
+    results: list[dict] = []
+    seen: set[str] = set()
+    if not _append_new(fetch_page(1), results, seen):
+        return results
+
+    prefetch = max(1, min(prefetch, pages - 1))
+    with ThreadPoolExecutor(max_workers=prefetch) as pool:
+        futures: dict[int, Future] = {}
+        next_page = 2
+        while next_page <= min(1 + prefetch, pages):
+            futures[next_page] = pool.submit(fetch_page, next_page)
+            next_page += 1
+
+        for page in range(2, pages + 1):
+            try:
+                page_results = futures.pop(page).result()
+            except Exception:
+                break
+            if not _append_new(page_results, results, seen):
+                break
+            if next_page <= pages:
+                futures[next_page] = pool.submit(fetch_page, next_page)
+                next_page += 1
+
+        for future in futures.values():
+            future.cancel()
+    return results
@@ -3,9 +3,13 @@ from __future__ import annotations
 import requests
 
 
-def fetch(query: str, base_url: str, timeout_s: int, user_agent: str) -> list[dict]:
+def fetch(
+    query: str, base_url: str, timeout_s: float, user_agent: str, page: int = 1
+) -> list[dict]:
     url = f"{base_url.rstrip('/')}/search"
     params = {"q": query, "format": "json"}
+    if page > 1:
+        params["pageno"] = page
     headers = {"User-Agent": user_agent}
     response = requests.get(url, params=params, headers=headers, timeout=timeout_s)
     response.raise_for_status()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Iterable, Iterator
+
+from sandcastle.processor.canonicalize import canonicalize_url
+
+REF_FIELDS = ("query", "engine", "rank", "timestamp")
+
+
+def url_id(url: str) -> str:
+    return hashlib.sha1(canonicalize_url(url).encode("utf-8")).hexdigest()[:16]
+
+
+class CompactWriter:
+    """Collect-time compaction of repeated canonical URLs.
+
+    The first sighting of a canonical URL is written in full with a ``url_id``. Later
+    sightings with the same title and snippet are written as references holding only
+    the query, engine, rank and timestamp. A sighting with different text is written in
+    full again, because dedupe may prefer its title and snippet.
+    """
+
+    def __init__(self) -> None:
+        self._seen: dict[str, int] = {}
+
+    def observe(self, records: Iterable[dict]) -> None:
+        """Load state from records already written to the log."""
+        for record in records:
+            if "url_id" in record:
+                self._seen[record["url_id"]] = hash(
+                    (record.get("title", ""), record.get("snippet", ""))
+                )
+
+    def compact(self, payloads: Iterable[dict]) -> list[dict]:
+        compacted: list[dict] = []
+        for payload in payloads:
+            key = url_id(payload["url"])
+            text_hash = hash((payload.get("title", ""), payload.get("snippet", "")))
+            if self._seen.get(key) == text_hash:
+                compacted.append({"ref": key, **{field: payload[field] for field in REF_FIELDS}})
+                continue
+            self._seen[key] = text_hash
+            compacted.append({**payload, "url_id": key})
+        return compacted
+
+
+def expand_records(
+    records: Iterable[dict], latest: dict[str, dict] | None = None
+) -> Iterator[dict]:
+    """Resolve compact references back into full collector records.
+
+    Records without a ``ref`` pass through unchanged, so plain logs are accepted too.
+    Pass the same ``latest`` map across calls to resolve references to earlier records.
+    """
+    if latest is None:
+        latest = {}
+    for record in records:
+        ref = record.get("ref")
+        if ref is None:
+            if "url_id" in record:
+                latest[record["url_id"]] = record
+            yield record
+            continue
+        base = latest.get(ref)
+        if base is None:
+            raise ValueError(f"Reference to unknown url_id {ref}")
+        yield {**base, **{field: record[field] for field in REF_FIELDS}}
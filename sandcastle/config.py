@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -21,12 +21,26 @@ class DedupeConfig:
     similarity_threshold: float
 
 
+@dataclass
+class TermsConfig:
+    max_counters: int | None = None
+
+
 @dataclass
 class SearchConfig:
     searx_url: str
     timeout_s: int
     max_retries: int
     user_agent: str
+    pages: dict[str, int] = field(default_factory=dict)
+    prefetch_pages: int = 3
+    query_deadline_s: float | None = None
+    hedge_percentile: float | None = None
+    hedge_min_samples: int = 10
+    searx_mirrors: list[str] = field(default_factory=list)
+
+    def page_depth(self, engine: str) -> int:
+        return max(1, self.pages.get(engine, 1))
 
 
 @dataclass
@@ -35,6 +49,7 @@ class Config:
     dedupe: DedupeConfig
     expansion: QueryExpansionConfig
     domain_filters: dict[str, Any]
+    terms: TermsConfig
 
 
 def load_yaml(path: Path) -> dict[str, Any]:
@@ -42,6 +57,22 @@ def load_yaml(path: Path) -> dict[str, Any]:
         return yaml.safe_load(handle)
 
 
+def _optional_float(value: Any) -> float | None:
+    return float(value) if value is not None else None
+
+
+def _validate_search(search: SearchConfig) -> None:
+    if search.prefetch_pages < 1:
+        raise ValueError("search.prefetch_pages must be at least 1")
+    for engine, depth in search.pages.items():
+        if depth < 1:
+            raise ValueError(f"search.pages.{engine} must be at least 1")
+    if search.hedge_percentile is not None and not 0 < search.hedge_percentile <= 100:
+        raise ValueError("search.hedge_percentile must be in (0, 100]")
+    if search.hedge_min_samples < 1:
+        raise ValueError("search.hedge_min_samples must be at least 1")
+
+
 def load_config(path: Path | None = None) -> Config:
     config_path = path or DEFAULT_CONFIG_PATH
     raw = load_yaml(config_path)
@@ -50,14 +81,34 @@ def load_config(path: Path | None = None) -> Config:
         timeout_s=int(raw["search"]["timeout_s"]),
         max_retries=int(raw["search"]["max_retries"]),
         user_agent=str(raw["search"]["user_agent"]),
+        pages={
+            str(engine): int(depth) for engine, depth in (raw["search"].get("pages") or {}).items()
+        },
+        prefetch_pages=int(raw["search"].get("prefetch_pages", 3)),
+        query_deadline_s=_optional_float(raw["search"].get("query_deadline_s")),
+        hedge_percentile=_optional_float(raw["search"].get("hedge_percentile")),
+        hedge_min_samples=int(raw["search"].get("hedge_min_samples", 10)),
+        searx_mirrors=[str(url) for url in raw["search"].get("searx_mirrors") or []],
     )
+    _validate_search(search)
     dedupe = DedupeConfig(similarity_threshold=float(raw["dedupe"]["similarity_threshold"]))
     expansion = QueryExpansionConfig(
         max_followups=int(raw["expansion"]["max_followups"]),
         max_queue_size=int(raw["expansion"]["max_queue_size"]),
     )
     domain_filters = raw.get("domain_filters", {})
-    return Config(search=search, dedupe=dedupe, expansion=expansion, domain_filters=domain_filters)
+    raw_terms = raw.get("terms") or {}
+    max_counters = raw_terms.get("max_counters")
+    terms = TermsConfig(max_counters=int(max_counters) if max_counters is not None else None)
+    if terms.max_counters is not None and terms.max_counters < 1:
+        raise ValueError("terms.max_counters must be at least 1")
+    return Config(
+        search=search,
+        dedupe=dedupe,
+        expansion=expansion,
+        domain_filters=domain_filters,
+        terms=terms,
+    )
 
 
 def load_domains(path: Path | None = None) -> dict[str, Any]:
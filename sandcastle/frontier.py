@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+
+@dataclass
+class FrontierTask:
+    query: str
+    engine: str
+    lease_id: str
+
+
+class Frontier(ABC):
+    """Shared work queue of (query, engine) tasks plus the set of queries already seen.
+
+    Workers lease tasks for a limited time. A task whose lease expires before it is
+    completed becomes available to other workers again, and only the holder of the
+    current lease can mark it done, so each (query, engine) completes exactly once.
+    """
+
+    @abstractmethod
+    def add_queries(
+        self, queries: Iterable[str], engines: list[str], max_pending: int | None = None
+    ) -> list[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def lease(self, worker_id: str, lease_s: float) -> FrontierTask | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def complete(self, task: FrontierTask) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def pending_queries(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_drained(self) -> bool:
+        raise NotImplementedError
+
+
+class SqliteFrontier(Frontier):
+    """Frontier stored in a local SQLite database.
+
+    WAL mode relies on shared memory, so all workers must run on the same host with the
+    database on a local disk; network filesystems are not supported.
+    """
+
+    def __init__(self, path: Path, timeout_s: float = 30.0) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path), timeout=timeout_s, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS seen_queries (query TEXT PRIMARY KEY)")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tasks (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                query TEXT NOT NULL,
+                engine TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                lease_id TEXT,
+                lease_owner TEXT,
+                lease_expires REAL,
+                UNIQUE (query, engine)
+            )
+            """
+        )
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def add_queries(
+        self, queries: Iterable[str], engines: list[str], max_pending: int | None = None
+    ) -> list[str]:
+        added: list[str] = []
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            pending = self._pending_queries()
+            for query in queries:
+                if max_pending is not None and pending >= max_pending:
+                    break
+                cursor = self.conn.execute(
+                    "INSERT OR IGNORE INTO seen_queries (query) VALUES (?)", (query,)
+                )
+                if cursor.rowcount == 0:
+                    continue
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO tasks (query, engine) VALUES (?, ?)",
+                    [(query, engine) for engine in engines],
+                )
+                added.append(query)
+                pending += 1
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def lease(self, worker_id: str, lease_s: float) -> FrontierTask | None:
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.conn.execute(
+                """
+                SELECT seq, query, engine FROM tasks
+                WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?)
+                ORDER BY seq LIMIT 1
+                """,
+                (now,),
+            ).fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+            seq, query, engine = row
+            lease_id = uuid.uuid4().hex
+            self.conn.execute(
+                "UPDATE tasks SET status = 'leased', lease_id = ?, lease_owner = ?, "
+                "lease_expires = ? WHERE seq = ?",
+                (lease_id, worker_id, now + lease_s, seq),
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return FrontierTask(query=query, engine=engine, lease_id=lease_id)
+
+    def complete(self, task: FrontierTask) -> bool:
+        cursor = self.conn.execute(
+            """
+            UPDATE tasks SET status = 'done', lease_expires = NULL
+            WHERE query = ? AND engine = ? AND status = 'leased' AND lease_id = ?
+            """,
+            (task.query, task.engine, task.lease_id),
+        )
+        return cursor.rowcount == 1
+
+    def _pending_queries(self) -> int:
+        row = self.conn.execute(
+            "SELECT COUNT(DISTINCT query) FROM tasks WHERE status = 'pending'"
+        ).fetchone()
+        return int(row[0])
+
+    def pending_queries(self) -> int:
+        return self._pending_queries()
+
+    def is_drained(self) -> bool:
+        row = self.conn.execute("SELECT COUNT(*) FROM tasks WHERE status != 'done'").fetchone()
+        return int(row[0]) == 0
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+
+MANIFEST_FILE = "manifest.json"
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def code_version() -> str:
+    """Digest of the package source, so any code change invalidates cached stages."""
+    digest = hashlib.sha256()
+    for path in sorted(PACKAGE_DIR.rglob("*.py")):
+        digest.update(path.relative_to(PACKAGE_DIR).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def stage_digest(files: list[Path], params: dict[str, object] | None = None) -> str:
+    """Digest a stage's input files (in order), parameters and the code version."""
+    digest = hashlib.sha256()
+    digest.update(code_version().encode("utf-8"))
+    for path in files:
+        digest.update(file_digest(path).encode("utf-8"))
+    digest.update(json.dumps(params or {}, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def source_digests(files: list[Path]) -> dict[str, str]:
+    """Map each file path to its content digest, for later :func:`sources_unchanged` checks."""
+    return {str(path): file_digest(path) for path in files}
+
+
+def sources_unchanged(recorded: dict[str, str]) -> bool:
+    """Whether every recorded file still exists with the same content digest."""
+    if not recorded:
+        return False
+    return all(
+        Path(path).is_file() and file_digest(Path(path)) == digest
+        for path, digest in recorded.items()
+    )
+
+
+class Manifest:
+    """Per-output-directory record of the input digest each stage was last run with."""
+
+    def __init__(self, out_path: Path) -> None:
+        self.out_path = out_path
+        self.path = out_path / MANIFEST_FILE
+        self.stages: dict[str, dict] = {}
+        if self.path.exists():
+            self.stages = json.loads(self.path.read_text(encoding="utf-8")).get("stages", {})
+
+    def is_fresh(self, stage: str, digest: str) -> bool:
+        entry = self.stages.get(stage)
+        if entry is None or entry.get("digest") != digest:
+            return False
+        return all((self.out_path / name).exists() for name in entry.get("outputs", []))
+
+    def record(self, stage: str, digest: str, outputs: list[str], **extra: object) -> None:
+        self.stages[stage] = {"digest": digest, "outputs": outputs, **extra}
+
+    def save(self) -> None:
+        self.out_path.mkdir(parents=True, exist_ok=True)
+        with self.path.open("w", encoding="utf-8") as handle:
+            json.dump({"stages": self.stages}, handle, indent=2, ensure_ascii=False, sort_keys=True)
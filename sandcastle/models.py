@@ -35,11 +35,13 @@ class ClusterSummary(BaseModel):
     top_terms: list[str]
     top_bigrams: list[str]
     intent_counts: dict[str, int]
+    error_bounds: dict[str, int] | None = None
 
 
 class TermsSummary(BaseModel):
     global_top_terms: list[list[str | int]]
     global_top_bigrams: list[list[str | int]]
+    error_bounds: dict[str, int] | None = None
 
 
 class StrategyItem(BaseModel):
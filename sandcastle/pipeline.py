@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from sandcastle.config import Config
+from sandcastle.models import ClusterSummary, TermsSummary
+from sandcastle.processor.clustering import build_clusters, recluster
+from sandcastle.processor.dedupe import DedupedRecord, NormalizedRecord, dedupe_records
+from sandcastle.processor.filters import apply_domain_filters
+from sandcastle.processor.index import build_index
+from sandcastle.processor.terms import aggregate_terms
+
+DEDUPE_CACHE_FILE = "dedupe_cache.json"
+
+
+@dataclass
+class ProcessOutputs:
+    deduped: list[dict]
+    clusters: list[dict]
+    terms: dict
+
+
+def write_json(path: Path, payload: object) -> None:
+    """Write JSON through a temporary file so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.tmp")
+    with temp_path.open("w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+def write_index(items: list[dict], path: Path) -> None:
+    """Build the search index in a sibling directory and swap it into place."""
+    temp_path = path.with_name(f"{path.name}.tmp")
+    shutil.rmtree(temp_path, ignore_errors=True)
+    build_index(items, temp_path)
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(temp_path, path)
+
+
+def deduped_payloads(deduped: list[DedupedRecord]) -> list[dict]:
+    return [
+        {
+            "id": item.id,
+            "canonical_url": item.canonical_url,
+            "title": item.title,
+            "snippet": item.snippet,
+            "engines": list(item.engines),
+            "best_rank": item.best_rank,
+            "cluster_ids": [],
+            "timestamp": item.timestamp,
+        }
+        for item in deduped
+    ]
+
+
+def dedupe_stage(normalized: list[NormalizedRecord], config: Config) -> list[dict]:
+    return deduped_payloads(
+        dedupe_records(normalized, threshold=config.dedupe.similarity_threshold)
+    )
+
+
+def cluster_stage(
+    deduped: list[dict],
+    config: Config,
+    domains: dict[str, Any],
+    keywords: list[str],
+) -> ProcessOutputs:
+    """Run domain filtering, clustering and term extraction on deduped payloads."""
+    filtered = apply_domain_filters(deduped, domains)
+    clusters = build_clusters(filtered, keywords, max_counters=config.terms.max_counters)
+    terms = aggregate_terms(filtered, max_counters=config.terms.max_counters)
+    return ProcessOutputs(
+        deduped=filtered,
+        clusters=[
+            ClusterSummary(**cluster.__dict__).model_dump(exclude_none=True) for cluster in clusters
+        ],
+        terms=TermsSummary(**terms).model_dump(exclude_none=True),
+    )
+
+
+def process_records(
+    normalized: list[NormalizedRecord],
+    config: Config,
+    domains: dict[str, Any],
+    keywords: list[str],
+) -> ProcessOutputs:
+    """Run dedupe, domain filtering, clustering and term extraction on normalized records."""
+    return cluster_stage(dedupe_stage(normalized, config), config, domains, keywords)
+
+
+def recluster_stage(
+    deduped: list[dict],
+    clusters: list[dict],
+    old_keywords: list[str],
+    new_keywords: list[str],
+    config: Config,
+) -> list[dict]:
+    """Update ``deduped`` cluster IDs in place and return the new cluster summaries."""
+    added, removed = recluster(
+        deduped, old_keywords, new_keywords, max_counters=config.terms.max_counters
+    )
+    kept = [cluster for cluster in clusters if cluster["cluster_id"] not in removed]
+    kept.extend(
+        ClusterSummary(**cluster.__dict__).model_dump(exclude_none=True) for cluster in added
+    )
+    return sorted(kept, key=lambda cluster: cluster["cluster_id"])
+
+
+def output_files(build_search_index: bool = False) -> list[str]:
+    files = ["deduped.json", "clusters.json", "terms.json"]
+    if build_search_index:
+        files.append("index/lexicon.json")
+    return files
+
+
+def write_outputs(
+    outputs: ProcessOutputs, out_path: Path, build_search_index: bool = False
+) -> None:
+    write_json(out_path / "deduped.json", outputs.deduped)
+    write_json(out_path / "clusters.json", outputs.clusters)
+    write_json(out_path / "terms.json", outputs.terms)
+    if build_search_index:
+        write_index(outputs.deduped, out_path / "index")
@@ -4,6 +4,7 @@ from collections import Counter, defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 
+from sandcastle.processor.sketch import SpaceSaving
 from sandcastle.processor.text import bigrams, tokenize_text, top_terms
 
 INTENT_TAGS = ["worksheet", "prompts", "pdf", "undated", "bundle", "printable"]
@@ -18,6 +19,7 @@ class ClusterResult:
     top_terms: list[str]
     top_bigrams: list[str]
     intent_counts: dict[str, int]
+    error_bounds: dict[str, int] | None = None
 
 
 def load_keywords(path: Path) -> list[str]:
@@ -43,14 +45,21 @@ def assign_clusters(text: str, keywords: list[str]) -> list[str]:
     return cluster_ids
 
 
-def build_clusters(items: list[dict], keywords: list[str]) -> list[ClusterResult]:
-    clusters: dict[str, dict] = defaultdict(lambda: {
-        "label": "",
-        "members": [],
-        "tokens": [],
-        "bigrams": [],
-        "intent_counts": Counter(),
-    })
+def build_clusters(
+    items: list[dict], keywords: list[str], max_counters: int | None = None
+) -> list[ClusterResult]:
+    if max_counters is not None:
+        return _build_clusters_streaming(items, keywords, max_counters)
+
+    clusters: dict[str, dict] = defaultdict(
+        lambda: {
+            "label": "",
+            "members": [],
+            "tokens": [],
+            "bigrams": [],
+            "intent_counts": Counter(),
+        }
+    )
 
     for item in items:
         text = f"{item['title']} {item['snippet']}"
@@ -85,3 +94,128 @@ def build_clusters(items: list[dict], keywords: list[str]) -> list[ClusterResult
         )
 
     return sorted(results, key=lambda item: item.cluster_id)
+
+
+def _top_counted(counter: Counter, limit: int) -> list[str]:
+    items_sorted = sorted(counter.items(), key=lambda item: (-item[1], item[0]))
+    return [term for term, _ in items_sorted[:limit]]
+
+
+def _build_clusters_streaming(
+    items: list[dict], keywords: list[str], max_counters: int
+) -> list[ClusterResult]:
+    """Cluster with one term and one bigram sketch per cluster.
+
+    ``max_counters`` is the budget of each sketch, so memory is bounded by
+    ``2 * max_counters`` per cluster rather than by the corpus vocabulary.
+    """
+    clusters: dict[str, dict] = defaultdict(
+        lambda: {
+            "label": "",
+            "members": [],
+            "tokens": SpaceSaving(max_counters),
+            "bigrams": SpaceSaving(max_counters),
+            "intent_counts": Counter(),
+        }
+    )
+
+    for item in items:
+        text = f"{item['title']} {item['snippet']}"
+        cluster_ids = assign_clusters(text, keywords)
+        item["cluster_ids"] = cluster_ids
+        if not cluster_ids:
+            continue
+        tokens = tokenize_text(text)
+        bi = bigrams(tokens)
+        intents_found = [tag for tag in INTENT_TAGS if tag in text.lower()]
+
+        for cluster_id in cluster_ids:
+            cluster = clusters[cluster_id]
+            cluster["label"] = cluster_id.replace("_", " ")
+            cluster["members"].append(item["id"])
+            cluster["tokens"].update(tokens)
+            cluster["bigrams"].update(bi)
+            cluster["intent_counts"].update(intents_found)
+
+    # Exact re-verification pass: only sketch candidates are counted, so memory stays
+    # bounded by ``max_counters`` per cluster.
+    exact: dict[str, tuple[Counter, Counter]] = {
+        cluster_id: (Counter(), Counter()) for cluster_id in clusters
+    }
+    candidates = {
+        cluster_id: (data["tokens"].candidates(), data["bigrams"].candidates())
+        for cluster_id, data in clusters.items()
+    }
+    for item in items:
+        if not item["cluster_ids"]:
+            continue
+        tokens = tokenize_text(f"{item['title']} {item['snippet']}")
+        bi = bigrams(tokens)
+        for cluster_id in item["cluster_ids"]:
+            term_candidates, bigram_candidates = candidates[cluster_id]
+            term_counter, bigram_counter = exact[cluster_id]
+            term_counter.update(token for token in tokens if token in term_candidates)
+            bigram_counter.update(pair for pair in bi if pair in bigram_candidates)
+
+    results: list[ClusterResult] = []
+    for cluster_id, data in clusters.items():
+        term_counter, bigram_counter = exact[cluster_id]
+        results.append(
+            ClusterResult(
+                cluster_id=cluster_id,
+                label=data["label"],
+                member_ids=data["members"],
+                count=len(data["members"]),
+                top_terms=_top_counted(term_counter, limit=10),
+                top_bigrams=_top_counted(bigram_counter, limit=10),
+                intent_counts=dict(data["intent_counts"]),
+                error_bounds={
+                    "terms": data["tokens"].error_bound,
+                    "bigrams": data["bigrams"].error_bound,
+                },
+            )
+        )
+
+    return sorted(results, key=lambda item: item.cluster_id)
+
+
+def _has_unique_ids(keywords: list[str]) -> bool:
+    return len({keyword_id(keyword) for keyword in keywords}) == len(keywords)
+
+
+def recluster(
+    items: list[dict],
+    old_keywords: list[str],
+    new_keywords: list[str],
+    max_counters: int | None = None,
+) -> tuple[list[ClusterResult], set[str]]:
+    """Update clustered items for an edited keyword list.
+
+    ``items`` must carry ``cluster_ids`` assigned from ``old_keywords``; they are rewritten
+    in place to match ``new_keywords``. Only clusters for added keywords are built. Returns
+    those clusters and the IDs of clusters that no longer exist or must be replaced.
+    """
+    old_ids = {keyword_id(keyword) for keyword in old_keywords}
+    old_set = set(old_keywords)
+    added = [keyword for keyword in new_keywords if keyword not in old_set]
+    ambiguous = any(keyword_id(keyword) in old_ids for keyword in added)
+    if ambiguous or not (_has_unique_ids(old_keywords) and _has_unique_ids(new_keywords)):
+        # Colliding keyword IDs make membership ambiguous, so rebuild every cluster.
+        return build_clusters(items, new_keywords, max_counters=max_counters), old_ids
+
+    new_ids = {keyword_id(keyword) for keyword in new_keywords}
+    removed = old_ids - new_ids
+
+    added_members: list[dict] = []
+    for item in items:
+        current = set(item["cluster_ids"])
+        lowered = f"{item['title']} {item['snippet']}".lower()
+        matched_added = [keyword for keyword in added if keyword in lowered]
+        if matched_added:
+            added_members.append({**item, "cluster_ids": []})
+        current.update(keyword_id(keyword) for keyword in matched_added)
+        item["cluster_ids"] = [
+            keyword_id(keyword) for keyword in new_keywords if keyword_id(keyword) in current
+        ]
+
+    return build_clusters(added_members, added, max_counters=max_counters), removed
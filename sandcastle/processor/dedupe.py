@@ -1,18 +1,13 @@
 from __future__ import annotations
 
 import hashlib
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Iterable
 
-import importlib.util
-
+from sandcastle.processor.similarity import TokenSignature, encode, find_similar
 from sandcastle.processor.canonicalize import canonicalize_url
 from sandcastle.processor.text import tokenize_text
 
-RAPIDFUZZ_JACCARD = None
-if importlib.util.find_spec("rapidfuzz.distance.Jaccard"):
-    from rapidfuzz.distance import Jaccard as RAPIDFUZZ_JACCARD
-
 
 @dataclass
 class NormalizedRecord:
@@ -76,53 +71,87 @@ def _jaccard_similarity(left: list[str], right: list[str]) -> float:
     return len(intersection) / len(union)
 
 
-def dedupe_records(records: list[NormalizedRecord], threshold: float) -> list[DedupedRecord]:
-    by_url: dict[str, DedupedRecord] = {}
-    for record in records:
-        existing = by_url.get(record.canonical_url)
-        if existing:
-            if record.rank < existing.best_rank:
-                existing.best_rank = record.rank
-                existing.title = record.title or existing.title
-                existing.snippet = record.snippet or existing.snippet
-                existing.timestamp = record.timestamp
-            if record.engine not in existing.engines:
-                existing.engines.append(record.engine)
-            continue
-        by_url[record.canonical_url] = DedupedRecord(
-            id=_record_id(record.canonical_url),
-            canonical_url=record.canonical_url,
-            title=record.title,
-            snippet=record.snippet,
-            engines=[record.engine],
-            best_rank=record.rank,
-            timestamp=record.timestamp,
-        )
-
-    deduped: list[DedupedRecord] = []
-    for record in by_url.values():
-        merged = False
-        record_tokens = _text_signature(record.title, record.snippet)
-        for existing in deduped:
-            existing_tokens = _text_signature(existing.title, existing.snippet)
-            if RAPIDFUZZ_JACCARD:
-                similarity = RAPIDFUZZ_JACCARD.similarity(record_tokens, existing_tokens)
-            else:
-                similarity = _jaccard_similarity(record_tokens, existing_tokens)
-            if similarity >= threshold:
-                merged = True
-                if record.best_rank < existing.best_rank:
-                    existing.best_rank = record.best_rank
+class DedupeIndex:
+    """Long-lived dedupe state that new records can be folded into.
+
+    Each call to :meth:`add` first merges the batch by exact canonical URL, then places
+    every newly seen URL against the existing near-duplicate groups. A single batch gives
+    the same result as a one-off dedupe. A URL seen again in a later batch updates the
+    group it already belongs to and is not re-placed.
+    """
+
+    def __init__(self, threshold: float) -> None:
+        self.threshold = threshold
+        self.by_url: dict[str, DedupedRecord] = {}
+        self.groups: list[DedupedRecord] = []
+        self._group_of: dict[str, int] = {}
+        self._signatures: list[TokenSignature] = []
+
+    def add(self, records: Iterable[NormalizedRecord]) -> None:
+        new_urls: list[str] = []
+        updated_urls: dict[str, None] = {}
+        for record in records:
+            existing = self.by_url.get(record.canonical_url)
+            if existing:
+                if record.rank < existing.best_rank:
+                    existing.best_rank = record.rank
                     existing.title = record.title or existing.title
                     existing.snippet = record.snippet or existing.snippet
-                    existing.canonical_url = record.canonical_url
-                    existing.id = record.id
                     existing.timestamp = record.timestamp
-                for engine in record.engines:
-                    if engine not in existing.engines:
-                        existing.engines.append(engine)
-                break
-        if not merged:
-            deduped.append(record)
-
-    return sorted(deduped, key=lambda item: (item.best_rank, item.canonical_url))
+                if record.engine not in existing.engines:
+                    existing.engines.append(record.engine)
+                if record.canonical_url in self._group_of:
+                    updated_urls[record.canonical_url] = None
+                continue
+            self.by_url[record.canonical_url] = DedupedRecord(
+                id=_record_id(record.canonical_url),
+                canonical_url=record.canonical_url,
+                title=record.title,
+                snippet=record.snippet,
+                engines=[record.engine],
+                best_rank=record.rank,
+                timestamp=record.timestamp,
+            )
+            new_urls.append(record.canonical_url)
+
+        for url in updated_urls:
+            self._merge_into(self._group_of[url], self.by_url[url])
+        for url in new_urls:
+            self._place(self.by_url[url])
+
+    def _signature(self, record: DedupedRecord) -> TokenSignature:
+        return encode(_text_signature(record.title, record.snippet))
+
+    def _place(self, record: DedupedRecord) -> None:
+        signature = self._signature(record)
+        match = find_similar(signature, self._signatures, self.threshold)
+        if match is None:
+            self._group_of[record.canonical_url] = len(self.groups)
+            self.groups.append(replace(record, engines=list(record.engines)))
+            self._signatures.append(signature)
+            return
+        self._group_of[record.canonical_url] = match
+        self._merge_into(match, record)
+
+    def _merge_into(self, index: int, record: DedupedRecord) -> None:
+        existing = self.groups[index]
+        if record.best_rank < existing.best_rank:
+            existing.best_rank = record.best_rank
+            existing.title = record.title or existing.title
+            existing.snippet = record.snippet or existing.snippet
+            existing.canonical_url = record.canonical_url
+            existing.id = record.id
+            existing.timestamp = record.timestamp
+            self._signatures[index] = self._signature(existing)
+        for engine in record.engines:
+            if engine not in existing.engines:
+                existing.engines.append(engine)
+
+    def records(self) -> list[DedupedRecord]:
+        return sorted(self.groups, key=lambda item: (item.best_rank, item.canonical_url))
+
+
+def dedupe_records(records: list[NormalizedRecord], threshold: float) -> list[DedupedRecord]:
+    index = DedupeIndex(threshold)
+    index.add(records)
+    return index.records()
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import json
+import mmap
+import shlex
+from array import array
+from collections import defaultdict
+from pathlib import Path
+
+from sandcastle.processor.text import bigrams, tokenize_text
+
+LEXICON_FILE = "lexicon.json"
+POSTINGS_FILE = "postings.bin"
+DOCS_FILE = "docs.jsonl"
+DOC_OFFSETS_FILE = "docs.offsets"
+TERMS_FILE = "terms.bin"
+TERM_OFFSETS_FILE = "terms.offsets"
+TERM_ENTRIES_FILE = "terms.entries"
+
+
+def encode_postings(doc_ids: list[int]) -> bytes:
+    """Encode sorted doc IDs as varint-compressed gaps."""
+    out = bytearray()
+    previous = 0
+    for doc_id in doc_ids:
+        gap = doc_id - previous
+        previous = doc_id
+        while gap >= 0x80:
+            out.append((gap & 0x7F) | 0x80)
+            gap >>= 7
+        out.append(gap)
+    return bytes(out)
+
+
+def decode_postings(data: bytes | memoryview) -> list[int]:
+    doc_ids: list[int] = []
+    current = 0
+    value = 0
+    shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        current += value
+        doc_ids.append(current)
+        value = 0
+        shift = 0
+    return doc_ids
+
+
+def build_index(items: list[dict], path: Path) -> None:
+    """Write a term/bigram/cluster inverted index over processed items to ``path``."""
+    term_postings: dict[str, list[int]] = defaultdict(list)
+    cluster_postings: dict[str, list[int]] = defaultdict(list)
+    path.mkdir(parents=True, exist_ok=True)
+
+    offsets = array("Q")
+    with (path / DOCS_FILE).open("wb") as docs_handle:
+        for doc_id, item in enumerate(items):
+            offsets.append(docs_handle.tell())
+            tokens = tokenize_text(f"{item['title']} {item['snippet']}")
+            doc = {
+                "id": item["id"],
+                "canonical_url": item["canonical_url"],
+                "title": item["title"],
+                "cluster_ids": item.get("cluster_ids", []),
+                "tokens": tokens,
+            }
+            docs_handle.write(json.dumps(doc, ensure_ascii=False).encode("utf-8") + b"\n")
+
+            for term in sorted(set(tokens).union(bigrams(tokens))):
+                term_postings[term].append(doc_id)
+            for cluster_id in dict.fromkeys(item.get("cluster_ids", [])):
+                cluster_postings[cluster_id].append(doc_id)
+
+    with (path / DOC_OFFSETS_FILE).open("wb") as handle:
+        offsets.tofile(handle)
+
+    # Terms are stored sorted by UTF-8 bytes in a flat table so readers can binary-search
+    # the memory-mapped files instead of parsing a vocabulary-sized lexicon.
+    term_offsets = array("Q", [0])
+    term_entries = array("Q")
+    lexicon: dict[str, object] = {"doc_count": len(items), "clusters": {}}
+    with (
+        (path / POSTINGS_FILE).open("wb") as handle,
+        (path / TERMS_FILE).open("wb") as terms_handle,
+    ):
+        for term in sorted(term_postings, key=lambda value: value.encode("utf-8")):
+            encoded = encode_postings(term_postings[term])
+            term_entries.extend([handle.tell(), len(encoded), len(term_postings[term])])
+            handle.write(encoded)
+            terms_handle.write(term.encode("utf-8"))
+            term_offsets.append(terms_handle.tell())
+        for cluster_id in sorted(cluster_postings):
+            encoded = encode_postings(cluster_postings[cluster_id])
+            lexicon["clusters"][cluster_id] = [
+                handle.tell(),
+                len(encoded),
+                len(cluster_postings[cluster_id]),
+            ]
+            handle.write(encoded)
+
+    with (path / TERM_OFFSETS_FILE).open("wb") as handle:
+        term_offsets.tofile(handle)
+    with (path / TERM_ENTRIES_FILE).open("wb") as handle:
+        term_entries.tofile(handle)
+    with (path / LEXICON_FILE).open("w", encoding="utf-8") as handle:
+        json.dump(lexicon, handle, ensure_ascii=False)
+
+
+def _map_file(path: Path) -> mmap.mmap | bytes:
+    with path.open("rb") as handle:
+        if path.stat().st_size == 0:
+            return b""
+        return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class InvertedIndex:
+    """Read-only view over an index written by :func:`build_index`.
+
+    The term table, postings and documents are memory-mapped and terms are found by
+    binary search, so opening the index only parses the small cluster lexicon. Phrases
+    are matched by intersecting the postings of their consecutive bigrams, and phrases
+    longer than two tokens are then checked against each candidate's stored tokens.
+    """
+
+    def __init__(self, path: Path) -> None:
+        lexicon = json.loads((path / LEXICON_FILE).read_text(encoding="utf-8"))
+        self.doc_count: int = lexicon["doc_count"]
+        self.clusters: dict[str, list[int]] = lexicon["clusters"]
+        self._postings = _map_file(path / POSTINGS_FILE)
+        self._docs = _map_file(path / DOCS_FILE)
+        self._offsets = memoryview(_map_file(path / DOC_OFFSETS_FILE)).cast("Q")
+        self._terms = _map_file(path / TERMS_FILE)
+        self._term_offsets = memoryview(_map_file(path / TERM_OFFSETS_FILE)).cast("Q")
+        self._term_entries = memoryview(_map_file(path / TERM_ENTRIES_FILE)).cast("Q")
+        self.term_count = len(self._term_offsets) - 1
+
+    def _term_at(self, position: int) -> bytes:
+        return bytes(self._terms[self._term_offsets[position] : self._term_offsets[position + 1]])
+
+    def _find_term(self, term: str) -> int | None:
+        key = term.encode("utf-8")
+        low, high = 0, self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._term_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.term_count and self._term_at(low) == key:
+            return low
+        return None
+
+    def _read(self, offset: int, length: int) -> set[int]:
+        return set(decode_postings(self._postings[offset : offset + length]))
+
+    def term_docs(self, term: str) -> set[int]:
+        position = self._find_term(term)
+        if position is None:
+            return set()
+        offset, length = self._term_entries[3 * position], self._term_entries[3 * position + 1]
+        return self._read(offset, length)
+
+    def cluster_docs(self, cluster_id: str) -> set[int]:
+        entry = self.clusters.get(cluster_id)
+        if entry is None:
+            return set()
+        offset, length, _ = entry
+        return self._read(offset, length)
+
+    def phrase_docs(self, tokens: list[str]) -> set[int]:
+        if len(tokens) == 1:
+            return self.term_docs(tokens[0])
+        result: set[int] | None = None
+        for pair in bigrams(tokens):
+            docs = self.term_docs(pair)
+            result = docs if result is None else result & docs
+            if not result:
+                return set()
+        if len(tokens) > 2:
+            # Shared bigrams do not prove adjacency, so longer phrases are checked exactly.
+            result = {
+                doc_id for doc_id in result if _contains_phrase(self.doc(doc_id)["tokens"], tokens)
+            }
+        return result or set()
+
+    def doc(self, doc_id: int) -> dict:
+        start = self._offsets[doc_id]
+        end = self._docs.find(b"\n", start)
+        return json.loads(self._docs[start:end])
+
+    def search(self, query: str) -> list[int]:
+        """Evaluate a query and return matching doc IDs in index order.
+
+        Whitespace-separated clauses are ANDed, ``OR`` separates alternatives, a leading
+        ``-`` or ``NOT`` negates a clause, quoted text is a phrase and ``cluster:<id>``
+        restricts to a cluster.
+        """
+        matched: set[int] = set()
+        for group in _parse_query(query):
+            matched |= self._evaluate(group)
+        return sorted(matched)
+
+    def _evaluate(self, clauses: list[tuple[bool, str, list[str]]]) -> set[int]:
+        result: set[int] | None = None
+        excluded: set[int] = set()
+        for negated, kind, value in clauses:
+            docs = self.cluster_docs(value[0]) if kind == "cluster" else self.phrase_docs(value)
+            if negated:
+                excluded |= docs
+                continue
+            result = docs if result is None else result & docs
+        if result is None:
+            if not excluded:
+                return set()
+            result = set(range(self.doc_count))
+        return result - excluded
+
+
+def _contains_phrase(tokens: list[str], phrase: list[str]) -> bool:
+    width = len(phrase)
+    return any(tokens[start : start + width] == phrase for start in range(len(tokens) - width + 1))
+
+
+def _parse_query(query: str) -> list[list[tuple[bool, str, list[str]]]]:
+    groups: list[list[tuple[bool, str, list[str]]]] = [[]]
+    negate_next = False
+    for part in shlex.split(query):
+        if part == "OR":
+            groups.append([])
+            continue
+        if part == "NOT":
+            negate_next = True
+            continue
+        negated = negate_next
+        negate_next = False
+        if part.startswith("-") and len(part) > 1:
+            negated = True
+            part = part[1:]
+        if part.startswith("cluster:"):
+            groups[-1].append((negated, "cluster", [part[len("cluster:") :]]))
+            continue
+        tokens = tokenize_text(part)
+        if tokens:
+            groups[-1].append((negated, "phrase", tokens))
+    return [group for group in groups if group]
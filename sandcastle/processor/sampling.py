@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import hashlib
+import math
+from collections import Counter, defaultdict
+from typing import Iterable, Iterator
+
+from sandcastle.processor.canonicalize import canonicalize_url
+from sandcastle.processor.text import bigrams, tokenize_text
+
+Z_95 = 1.96
+
+
+def sample_key(seed: int, canonical_url: str) -> float:
+    digest = hashlib.sha1(f"{seed}:{canonical_url}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") / 2**64
+
+
+class UrlHashSampler:
+    """Deterministic streaming sample of collector records by canonical URL hash.
+
+    Records are kept when a seeded hash of their canonical URL falls below ``rate``, so
+    every sighting of a URL is kept or dropped together and exact duplicates still
+    collapse in dedupe. The sample is uniform over URLs, not stratified. Seen and kept
+    counts are only reported per (query, engine) group.
+    """
+
+    def __init__(self, rate: float, seed: int = 0) -> None:
+        if not 0 < rate <= 1:
+            raise ValueError("rate must be in (0, 1]")
+        self.rate = rate
+        self.seed = seed
+        self.groups: dict[tuple[str, str], list[int]] = defaultdict(lambda: [0, 0])
+
+    def sample(self, records: Iterable[dict]) -> Iterator[dict]:
+        for record in records:
+            counts = self.groups[(record["query"], record["engine"])]
+            counts[0] += 1
+            if sample_key(self.seed, canonicalize_url(record["url"])) < self.rate:
+                counts[1] += 1
+                yield record
+
+    def report(self) -> dict:
+        seen = sum(counts[0] for counts in self.groups.values())
+        kept = sum(counts[1] for counts in self.groups.values())
+        return {
+            "rate": self.rate,
+            "seed": self.seed,
+            "records_seen": seen,
+            "records_sampled": kept,
+            "groups": [
+                {"query": query, "engine": engine, "seen": counts[0], "sampled": counts[1]}
+                for (query, engine), counts in sorted(self.groups.items())
+            ],
+        }
+
+
+def estimate_count(sample_count: int, rate: float, sum_squares: float | None = None) -> dict:
+    """Scale a sample count to the full corpus with an approximate 95% interval.
+
+    Each sampled item is a unit kept independently with probability ``rate``.
+    ``sum_squares`` is the sum of each item's squared contribution to the count, so items
+    that contribute many correlated occurrences widen the interval; by default every
+    item contributes one. Sampling is really per canonical URL, so a near-duplicate
+    group of ``m`` URLs survives with probability ``1 - (1 - rate) ** m`` and group
+    counts are biased upward.
+    """
+    squares = sample_count if sum_squares is None else sum_squares
+    spread = Z_95 * math.sqrt(squares * (1 - rate)) / rate
+    return {
+        "sample": sample_count,
+        "estimate": round(sample_count / rate, 1),
+        "ci95": round(spread, 1),
+    }
+
+
+def occurrence_squares(items: list[dict]) -> tuple[Counter, Counter]:
+    """Per-term and per-bigram sums of squared per-item occurrence counts."""
+    terms: Counter = Counter()
+    pairs: Counter = Counter()
+    for item in items:
+        tokens = tokenize_text(f"{item['title']} {item['snippet']}")
+        for term, count in Counter(tokens).items():
+            terms[term] += count * count
+        for pair, count in Counter(bigrams(tokens)).items():
+            pairs[pair] += count * count
+    return terms, pairs
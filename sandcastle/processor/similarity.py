@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+SIGNATURE_BITS = 256
+
+
+@dataclass(frozen=True)
+class TokenSignature:
+    """A cached token set plus a fixed-width bitset of its hashed tokens.
+
+    The token set is what similarity is computed on. Bit ``hash(token) % SIGNATURE_BITS``
+    is set for each token, so the bitset does not grow with the vocabulary; it only
+    feeds the optional :func:`jaccard_upper_bound` prefilter, which accounts for hash
+    collisions.
+    """
+
+    bits: int
+    tokens: frozenset[str]
+
+
+def encode(tokens: Iterable[str], width: int = SIGNATURE_BITS) -> TokenSignature:
+    token_set = frozenset(tokens)
+    bits = 0
+    for token in token_set:
+        bits |= 1 << (hash(token) % width)
+    return TokenSignature(bits=bits, tokens=token_set)
+
+
+def jaccard(left: TokenSignature, right: TokenSignature) -> float:
+    """Exact Jaccard similarity, matching ``_jaccard_similarity`` on the token sets.
+
+    Two empty sets score 1.0 and one empty set scores 0.0.
+    """
+    intersection = len(left.tokens & right.tokens)
+    union = len(left.tokens) + len(right.tokens) - intersection
+    return intersection / union if union else 1.0
+
+
+def jaccard_upper_bound(left: TokenSignature, right: TokenSignature) -> float:
+    """Upper bound on :func:`jaccard` computed from the hashed bitsets.
+
+    A bit set on only one side must come from a token missing on the other side, so
+    those popcounts are lower bounds on the set differences, and hence bound the
+    intersection from above.
+    """
+    left_size = len(left.tokens)
+    right_size = len(right.tokens)
+    intersection = min(
+        left_size - (left.bits & ~right.bits).bit_count(),
+        right_size - (right.bits & ~left.bits).bit_count(),
+    )
+    union = left_size + right_size - intersection
+    return intersection / union if union else 1.0
+
+
+def find_similar(
+    query: TokenSignature,
+    candidates: Sequence[TokenSignature],
+    threshold: float,
+    prefilter: bool = True,
+) -> int | None:
+    """Index of the first candidate whose similarity to ``query`` reaches ``threshold``.
+
+    Candidates are scanned one at a time against their cached token sets. With
+    ``prefilter``, a candidate whose :func:`jaccard_upper_bound` is below ``threshold``
+    skips the exact set comparison; the result is the same either way.
+    """
+    for index, candidate in enumerate(candidates):
+        if prefilter and jaccard_upper_bound(query, candidate) < threshold:
+            continue
+        if jaccard(query, candidate) >= threshold:
+            return index
+    return None
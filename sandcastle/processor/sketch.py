@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import heapq
+from collections import Counter
+from typing import Callable, Iterable
+
+
+class SpaceSaving:
+    """Space-Saving heavy-hitter sketch holding at most ``capacity`` counters.
+
+    Any key whose true count exceeds ``error_bound`` is guaranteed to be tracked, and a
+    tracked key's estimate overshoots its true count by at most ``error_bound``.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.counts: dict[str, int] = {}
+        self.total = 0
+        self._heap: list[tuple[int, str]] = []
+
+    def add(self, key: str) -> None:
+        self.total += 1
+        count = self.counts.get(key)
+        if count is None:
+            if len(self.counts) < self.capacity:
+                count = 0
+            else:
+                count = self._evict_min()
+        count += 1
+        self.counts[key] = count
+        heapq.heappush(self._heap, (count, key))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(value, name) for name, value in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def update(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self.add(key)
+
+    def _evict_min(self) -> int:
+        while True:
+            count, key = heapq.heappop(self._heap)
+            if self.counts.get(key) == count:
+                del self.counts[key]
+                return count
+
+    @property
+    def error_bound(self) -> int:
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+
+    def candidates(self) -> set[str]:
+        return set(self.counts)
+
+
+def verified_top(
+    sketch: SpaceSaving,
+    stream: Callable[[], Iterable[str]],
+    limit: int,
+) -> tuple[list[tuple[str, int]], int]:
+    """Re-count the sketch candidates exactly over a second pass of ``stream``.
+
+    Returns the top ``limit`` (term, exact count) pairs and the bound on the count of
+    any term the sketch may have missed.
+    """
+    candidates = sketch.candidates()
+    exact: Counter[str] = Counter(key for key in stream() if key in candidates)
+    items_sorted = sorted(exact.items(), key=lambda item: (-item[1], item[0]))
+    return items_sorted[:limit], sketch.error_bound
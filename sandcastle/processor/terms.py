@@ -2,10 +2,14 @@ from __future__ import annotations
 
 from collections import Counter
 
+from sandcastle.processor.sketch import SpaceSaving, verified_top
 from sandcastle.processor.text import bigrams, tokenize_text
 
 
-def aggregate_terms(items: list[dict], limit: int = 20) -> dict:
+def aggregate_terms(items: list[dict], limit: int = 20, max_counters: int | None = None) -> dict:
+    if max_counters is not None:
+        return _aggregate_terms_streaming(items, limit, max_counters)
+
     term_counter = Counter()
     bigram_counter = Counter()
 
@@ -23,3 +27,31 @@ def aggregate_terms(items: list[dict], limit: int = 20) -> dict:
         "global_top_terms": _top(term_counter),
         "global_top_bigrams": _top(bigram_counter),
     }
+
+
+def _aggregate_terms_streaming(items: list[dict], limit: int, max_counters: int) -> dict:
+    def _tokens():
+        for item in items:
+            yield tokenize_text(f"{item['title']} {item['snippet']}")
+
+    def _terms():
+        for tokens in _tokens():
+            yield from tokens
+
+    def _bigrams():
+        for tokens in _tokens():
+            yield from bigrams(tokens)
+
+    term_sketch = SpaceSaving(max_counters)
+    bigram_sketch = SpaceSaving(max_counters)
+    for tokens in _tokens():
+        term_sketch.update(tokens)
+        bigram_sketch.update(bigrams(tokens))
+
+    top_terms, term_error = verified_top(term_sketch, _terms, limit)
+    top_bigrams, bigram_error = verified_top(bigram_sketch, _bigrams, limit)
+    return {
+        "global_top_terms": [[term, count] for term, count in top_terms],
+        "global_top_bigrams": [[term, count] for term, count in top_bigrams],
+        "error_bounds": {"terms": term_error, "bigrams": bigram_error},
+    }
@@ -0,0 +1 @@
+"""Reasoning backends and executor."""
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ReasoningResult:
+    cluster_id: str
+    recommendation: str
+    priority: int
+    questions: list[str] = field(default_factory=list)
+
+
+class ReasoningBackend(ABC):
+    """Interface for backends that reason over a batch of cluster summaries."""
+
+    name = "base"
+
+    @abstractmethod
+    def reason_batch(self, clusters: list[dict]) -> list[ReasoningResult]:
+        raise NotImplementedError
+
+
+class StubBackend(ReasoningBackend):
+    """Deterministic local backend that returns placeholder outputs.
+
+    ``latency_s`` simulates the cost of one backend call so executor throughput can be
+    measured without a real model.
+    """
+
+    name = "stub"
+
+    def __init__(self, latency_s: float = 0.0) -> None:
+        self.latency_s = latency_s
+        self.calls = 0
+
+    def reason_batch(self, clusters: list[dict]) -> list[ReasoningResult]:
+        self.calls += 1
+        if self.latency_s > 0:
+            time.sleep(self.latency_s)
+        return [
+            ReasoningResult(
+                cluster_id=cluster["cluster_id"],
+                recommendation="TODO: analyze with LLM",
+                priority=0,
+                questions=["TODO: generate with LLM"],
+            )
+            for cluster in clusters
+        ]
+
+
+BACKENDS: dict[str, type[ReasoningBackend]] = {
+    StubBackend.name: StubBackend,
+}
+
+
+def get_backend(name: str, **kwargs: object) -> ReasoningBackend:
+    try:
+        backend_cls = BACKENDS[name]
+    except KeyError as exc:
+        raise ValueError(f"Unknown reasoning backend: {name}") from exc
+    return backend_cls(**kwargs)
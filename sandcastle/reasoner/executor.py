@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from sandcastle.reasoner.backends import ReasoningBackend, ReasoningResult
+
+
+@dataclass
+class ReasoningStats:
+    clusters: int = 0
+    cached: int = 0
+    batches: int = 0
+
+
+def cluster_digest(cluster: dict) -> str:
+    payload = json.dumps(cluster, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ReasonCache:
+    """Content-addressed store of reasoning results keyed by backend and cluster digest."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        if path is not None and path.exists():
+            self.entries = json.loads(path.read_text(encoding="utf-8"))
+
+    @staticmethod
+    def key(backend: ReasoningBackend, cluster: dict) -> str:
+        return f"{backend.name}:{cluster_digest(cluster)}"
+
+    def get(self, key: str) -> ReasoningResult | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        return ReasoningResult(**entry)
+
+    def put(self, key: str, result: ReasoningResult) -> None:
+        self.entries[key] = asdict(result)
+
+    def retain(self, backend: ReasoningBackend, keys: list[str]) -> None:
+        """Drop ``backend``'s entries for clusters that are not part of the current run.
+
+        Entries written by other backends are kept.
+        """
+        prefix = f"{backend.name}:"
+        wanted = set(keys)
+        self.entries = {
+            key: entry
+            for key, entry in self.entries.items()
+            if key in wanted or not key.startswith(prefix)
+        }
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("w", encoding="utf-8") as handle:
+            json.dump(self.entries, handle, indent=2, ensure_ascii=False, sort_keys=True)
+
+
+def _reason_checked(backend: ReasoningBackend, batch: list[dict]) -> list[ReasoningResult]:
+    results = backend.reason_batch(batch)
+    expected = [cluster["cluster_id"] for cluster in batch]
+    if [result.cluster_id for result in results] != expected:
+        raise ValueError(
+            f"Backend {backend.name} returned results out of order for batch {expected}"
+        )
+    return results
+
+
+def run_reasoning(
+    clusters: list[dict],
+    backend: ReasoningBackend,
+    cache: ReasonCache | None = None,
+    max_workers: int = 4,
+    batch_size: int = 8,
+) -> tuple[list[ReasoningResult], ReasoningStats]:
+    """Reason over clusters with cached lookups, batching and bounded concurrency.
+
+    Results are returned in the same order as ``clusters`` regardless of completion order.
+    The backend's cache entries are pruned to the current clusters and saved even when
+    a batch fails.
+    """
+    stats = ReasoningStats(clusters=len(clusters))
+    results: list[ReasoningResult | None] = [None] * len(clusters)
+    keys: list[str] = []
+    pending: list[int] = []
+    for idx, cluster in enumerate(clusters):
+        key = ReasonCache.key(backend, cluster)
+        keys.append(key)
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            results[idx] = cached
+            stats.cached += 1
+        else:
+            pending.append(idx)
+
+    step = max(1, batch_size)
+    batches = [pending[start : start + step] for start in range(0, len(pending), step)]
+    stats.batches = len(batches)
+    first_error: Exception | None = None
+    try:
+        if batches:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+                futures = {
+                    pool.submit(_reason_checked, backend, [clusters[idx] for idx in batch]): batch
+                    for batch in batches
+                }
+                for future in as_completed(futures):
+                    try:
+                        batch_results = future.result()
+                    except Exception as exc:
+                        first_error = first_error or exc
+                        continue
+                    for idx, result in zip(futures[future], batch_results):
+                        results[idx] = result
+                        if cache is not None:
+                            cache.put(keys[idx], result)
+        if first_error is not None:
+            raise first_error
+    finally:
+        # Completed batches are kept even if another batch failed.
+        if cache is not None:
+            cache.retain(backend, keys)
+            cache.save()
+
+    return [result for result in results if result is not None], stats
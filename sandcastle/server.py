@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Iterable
+
+from sandcastle.compact import expand_records
+from sandcastle.config import load_config, load_domains
+from sandcastle.pipeline import ProcessOutputs, cluster_stage, deduped_payloads, write_outputs
+from sandcastle.processor.clustering import load_keywords
+from sandcastle.processor.dedupe import DedupeIndex, NormalizedRecord, normalize_records
+
+
+class PipelineState:
+    """Config, keywords and a warm dedupe index kept in memory between requests.
+
+    Ingested records are folded into the dedupe index as they arrive. Snapshots only
+    rerun filtering, clustering and term extraction, and only after the data or config
+    changed.
+    """
+
+    def __init__(
+        self,
+        config_path: Path | None,
+        domains_path: Path | None,
+        keywords_path: Path,
+        out_path: Path | None = None,
+    ) -> None:
+        self.config_path = config_path
+        self.domains_path = domains_path
+        self.keywords_path = keywords_path
+        self.out_path = out_path
+        self.records: list[NormalizedRecord] = []
+        self.counters = {"records": 0, "rejected": 0, "builds": 0, "writes": 0}
+        self.dedupe: DedupeIndex | None = None
+        self._latest: dict[str, dict] = {}
+        self._snapshot: ProcessOutputs | None = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self.reload()
+
+    def reload(self) -> None:
+        with self._lock:
+            self.config = load_config(self.config_path)
+            self.domains = load_domains(self.domains_path)
+            self.keywords = load_keywords(self.keywords_path)
+            threshold = self.config.dedupe.similarity_threshold
+            if self.dedupe is None or self.dedupe.threshold != threshold:
+                self.dedupe = DedupeIndex(threshold)
+                self.dedupe.add(self.records)
+            self._snapshot = None
+
+    def add_records(self, records: Iterable[dict]) -> int:
+        """Fold collector records (plain or compact references) into the dedupe index."""
+        with self._lock:
+            normalized: list[NormalizedRecord] = []
+            for record in records:
+                try:
+                    normalized.extend(normalize_records(expand_records([record], self._latest)))
+                except (AttributeError, KeyError, TypeError, ValueError):
+                    self.counters["rejected"] += 1
+            self.records.extend(normalized)
+            self.dedupe.add(normalized)
+            self.counters["records"] += len(normalized)
+            if normalized:
+                self._snapshot = None
+        return len(normalized)
+
+    def snapshot(self) -> ProcessOutputs:
+        with self._lock:
+            if self._snapshot is None:
+                deduped = deduped_payloads(self.dedupe.records())
+                self._snapshot = cluster_stage(deduped, self.config, self.domains, self.keywords)
+                self.counters["builds"] += 1
+            return self._snapshot
+
+    def write(self, build_search_index: bool = False) -> Path:
+        if self.out_path is None:
+            raise ValueError("Server was started without --outdir")
+        outputs = self.snapshot()
+        # Request handlers run on their own threads; one write at a time keeps the output
+        # files from different snapshots from interleaving.
+        with self._write_lock:
+            write_outputs(outputs, self.out_path, build_search_index=build_search_index)
+            self.counters["writes"] += 1
+        return self.out_path
+
+    def status(self) -> dict[str, Any]:
+        return {"counters": dict(self.counters), "stale": self._snapshot is None}
+
+
+class PipelineHandler(BaseHTTPRequestHandler):
+    state: PipelineState
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send(self.state.status())
+        elif self.path == "/deduped":
+            self._send(self.state.snapshot().deduped)
+        elif self.path == "/clusters":
+            self._send(self.state.snapshot().clusters)
+        elif self.path == "/terms":
+            self._send(self.state.snapshot().terms)
+        else:
+            self._send({"error": f"Unknown path: {self.path}"}, HTTPStatus.NOT_FOUND)
+
+    def do_POST(self) -> None:
+        try:
+            body = self._read_body()
+        except ValueError as exc:
+            self._send({"error": f"Invalid JSON: {exc}"}, HTTPStatus.BAD_REQUEST)
+            return
+
+        if self.path == "/records":
+            records = body if isinstance(body, list) else [body]
+            accepted = self.state.add_records(records)
+            self._send({"accepted": accepted, "rejected": len(records) - accepted})
+        elif self.path == "/process":
+            started = time.perf_counter()
+            try:
+                options = body if isinstance(body, dict) else {}
+                out_path = self.state.write(build_search_index=bool(options.get("index", False)))
+            except ValueError as exc:
+                self._send({"error": str(exc)}, HTTPStatus.CONFLICT)
+                return
+            elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+            self._send({"outdir": str(out_path), "elapsed_ms": elapsed_ms})
+        elif self.path == "/reload":
+            self.state.reload()
+            self._send(self.state.status())
+        else:
+            self._send({"error": f"Unknown path: {self.path}"}, HTTPStatus.NOT_FOUND)
+
+    def _read_body(self) -> Any:
+        length = int(self.headers.get("Content-Length", 0))
+        raw = self.rfile.read(length).decode("utf-8") if length else ""
+        if not raw.strip():
+            return None
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            # Accept collector JSONL as-is.
+            return [json.loads(line) for line in raw.splitlines() if line.strip()]
+
+    def _send(self, payload: object, status: HTTPStatus = HTTPStatus.OK) -> None:
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+
+def make_server(
+    state: PipelineState, host: str = "127.0.0.1", port: int = 8765
+) -> ThreadingHTTPServer:
+    handler = type("BoundPipelineHandler", (PipelineHandler,), {"state": state})
+    return ThreadingHTTPServer((host, port), handler)
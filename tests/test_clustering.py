@@ -1,4 +1,4 @@
-from sandcastle.processor.clustering import assign_clusters, build_clusters
+from sandcastle.processor.clustering import assign_clusters, build_clusters, recluster
 
 
 def test_assign_clusters_multi_label():
@@ -29,3 +29,42 @@ def test_intent_counts():
     clusters = build_clusters(items, keywords)
     assert clusters[0].intent_counts["worksheet"] == 1
     assert clusters[0].intent_counts["pdf"] == 1
+
+
+def test_streaming_clusters_match_exact():
+    items = [
+        {
+            "id": "a",
+            "title": "Anxiety journal pdf",
+            "snippet": "printable anxiety",
+            "cluster_ids": [],
+        },
+        {"id": "b", "title": "Anxiety workbook", "snippet": "journal prompts", "cluster_ids": []},
+    ]
+    keywords = ["anxiety", "journal"]
+    exact = build_clusters([dict(item) for item in items], keywords)
+    streaming = build_clusters([dict(item) for item in items], keywords, max_counters=50)
+    for left, right in zip(exact, streaming):
+        assert left.top_terms == right.top_terms
+        assert left.top_bigrams == right.top_bigrams
+        assert right.error_bounds == {"terms": 0, "bigrams": 0}
+
+
+def test_recluster_matches_full_rebuild():
+    items = [
+        {"id": "a", "title": "Anxiety journal pdf", "snippet": "printable", "cluster_ids": []},
+        {"id": "b", "title": "Mindfulness journal", "snippet": "gratitude pdf", "cluster_ids": []},
+        {"id": "c", "title": "Gratitude prompts", "snippet": "", "cluster_ids": []},
+    ]
+    old_keywords = ["anxiety", "pdf", "mindfulness"]
+    new_keywords = ["gratitude", "anxiety", "mindfulness"]
+    incremental = [dict(item) for item in items]
+    build_clusters(incremental, old_keywords)
+    added, removed = recluster(incremental, old_keywords, new_keywords)
+
+    full = [dict(item) for item in items]
+    expected = build_clusters(full, new_keywords)
+    assert removed == {"pdf"}
+    assert [cluster.cluster_id for cluster in added] == ["gratitude"]
+    assert added[0] == next(cluster for cluster in expected if cluster.cluster_id == "gratitude")
+    assert [item["cluster_ids"] for item in incremental] == [item["cluster_ids"] for item in full]
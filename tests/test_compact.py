@@ -0,0 +1,47 @@
+from sandcastle.compact import CompactWriter, expand_records
+
+
+def record(url, engine="searxng", rank=1, title="Anxiety journal"):
+    return {
+        "query": "test",
+        "engine": engine,
+        "rank": rank,
+        "url": url,
+        "title": title,
+        "snippet": "Printable prompts",
+        "timestamp": "2026-02-06T10:30:00Z",
+        "raw_metadata": {},
+    }
+
+
+def test_repeated_canonical_urls_become_references():
+    writer = CompactWriter()
+    compacted = writer.compact(
+        [
+            record("https://example.com/page?utm_source=x"),
+            record("https://www.example.com/page", engine="brave", rank=3),
+            record("https://example.com/page", rank=2, title="Updated title"),
+        ]
+    )
+    assert "url_id" in compacted[0]
+    assert set(compacted[1]) == {"ref", "query", "engine", "rank", "timestamp"}
+    assert "title" in compacted[2]
+
+
+def test_expand_round_trip():
+    records = [
+        record("https://example.com/page"),
+        record("https://example.com/page/", engine="brave", rank=4),
+    ]
+    expanded = list(expand_records(CompactWriter().compact(records)))
+    assert [(item["engine"], item["rank"], item["title"]) for item in expanded] == [
+        ("searxng", 1, "Anxiety journal"),
+        ("brave", 4, "Anxiety journal"),
+    ]
+
+
+def test_writer_resumes_from_existing_log():
+    existing = CompactWriter().compact([record("https://example.com/page")])
+    writer = CompactWriter()
+    writer.observe(existing)
+    assert "ref" in writer.compact([record("https://example.com/page", rank=5)])[0]
@@ -1,4 +1,7 @@
-from sandcastle.processor.dedupe import dedupe_records, normalize_records
+import random
+
+from sandcastle.processor.similarity import encode, find_similar, jaccard, jaccard_upper_bound
+from sandcastle.processor.dedupe import _jaccard_similarity, dedupe_records, normalize_records
 
 
 def sample_records():
@@ -53,3 +56,20 @@ def test_near_duplicate_threshold_respected():
     normalized = normalize_records(sample_records())
     deduped = dedupe_records(normalized, threshold=0.95)
     assert len(deduped) == 2
+
+
+def test_signature_kernel_matches_set_jaccard():
+    rng = random.Random(0)
+    vocab = [f"t{idx}" for idx in range(30)]
+    token_lists = [rng.sample(vocab, rng.randint(0, 8)) for _ in range(50)]
+    # A narrow bitset forces hash collisions, which must never break the upper bound.
+    signatures = [encode(tokens, width=8) for tokens in token_lists]
+    for tokens, signature in zip(token_lists, signatures):
+        for other_tokens, other in zip(token_lists, signatures):
+            expected = _jaccard_similarity(tokens, other_tokens)
+            assert jaccard(signature, other) == expected
+            assert jaccard_upper_bound(signature, other) >= expected
+    for threshold in (0.3, 0.6, 1.0):
+        filtered = find_similar(signatures[3], signatures, threshold)
+        assert filtered == find_similar(signatures[3], signatures, threshold, prefilter=False)
+        assert filtered <= 3
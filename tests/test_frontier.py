@@ -0,0 +1,80 @@
+from sandcastle import cli
+from sandcastle.config import load_config
+from sandcastle.frontier import SqliteFrontier
+
+
+def test_seen_queries_are_not_requeued(tmp_path):
+    frontier = SqliteFrontier(tmp_path / "frontier.sqlite")
+    assert frontier.add_queries(["a", "b"], ["searxng", "brave"]) == ["a", "b"]
+    assert frontier.add_queries(["b", "c"], ["searxng", "brave"], max_pending=2) == []
+    assert frontier.pending_queries() == 2
+
+
+def test_completion_is_exactly_once(tmp_path):
+    path = tmp_path / "frontier.sqlite"
+    first = SqliteFrontier(path)
+    second = SqliteFrontier(path)
+    first.add_queries(["a"], ["searxng"])
+
+    expired = first.lease("w1", lease_s=-1)
+    retried = second.lease("w2", lease_s=60)
+    assert retried is not None and retried.query == "a"
+    assert second.lease("w2", lease_s=60) is None
+    assert first.complete(expired) is False
+    assert second.complete(retried) is True
+    assert second.complete(retried) is False
+    assert first.is_drained()
+
+
+def test_worker_drains_frontier_and_expands(tmp_path, monkeypatch, capsys):
+    def fake_fetch(engine, query, config, hedger=None, deadline=None):
+        assert deadline is not None
+        return [
+            {
+                "rank": 1,
+                "url": f"https://{engine}.com/{query}",
+                "title": "Anxiety journal",
+                "snippet": "",
+            }
+        ]
+
+    monkeypatch.setattr(cli, "fetch_engine", fake_fetch)
+    config = load_config()
+    config.search.query_deadline_s = 30
+    frontier = SqliteFrontier(tmp_path / "frontier.sqlite")
+    out_path = tmp_path / "collector.jsonl"
+    completed = cli.run_worker(
+        frontier, ["anxiety"], ["searxng", "brave"], out_path, config, ["journal"], "w1", 60
+    )
+
+    assert frontier.is_drained()
+    assert completed == 4
+    records = list(cli.read_records([tmp_path / "collector.w1.jsonl"]))
+    assert {record["query"] for record in records} == {"anxiety", "anxiety journal"}
+    assert "Run stats: 4 queries" in capsys.readouterr().out
+
+
+def test_worker_discards_results_after_losing_lease(tmp_path, monkeypatch):
+    path = tmp_path / "frontier.sqlite"
+    other = SqliteFrontier(path)
+
+    def fake_fetch(engine, query, config, hedger=None, deadline=None):
+        stolen = other.lease("w2", lease_s=60)
+        assert other.complete(stolen)
+        return [
+            {"rank": 1, "url": "https://example.com", "title": "Anxiety journal", "snippet": ""}
+        ]
+
+    monkeypatch.setattr(cli, "fetch_engine", fake_fetch)
+    completed = cli.run_worker(
+        SqliteFrontier(path),
+        ["anxiety"],
+        ["searxng"],
+        tmp_path / "collector.jsonl",
+        load_config(),
+        None,
+        "w1",
+        -1,
+    )
+    assert completed == 0
+    assert not (tmp_path / "collector.w1.jsonl").exists()
@@ -0,0 +1,120 @@
+import threading
+import time
+
+import pytest
+
+from sandcastle import cli
+from sandcastle.collectors.hedging import Hedger, percentile
+from sandcastle.config import load_config
+
+
+def test_percentile_nearest_rank():
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 99) == 4.0
+
+
+def test_hedge_wins_when_primary_is_slow():
+    hedger = Hedger(hedge_percentile=90, min_samples=3)
+    for _ in range(3):
+        hedger.tracker.record("searxng", 0.01)
+
+    def slow():
+        time.sleep(0.5)
+        return "primary"
+
+    started = time.perf_counter()
+    assert hedger.call("searxng", [slow, lambda: "mirror"]) == "mirror"
+    assert time.perf_counter() - started < 0.4
+    assert hedger.stats.hedges == 1
+    assert hedger.stats.hedge_wins == 1
+    hedger.close()
+
+
+def test_no_hedge_without_latency_history():
+    hedger = Hedger(hedge_percentile=90, min_samples=3)
+    assert hedger.call("searxng", [lambda: "primary", lambda: "mirror"]) == "primary"
+    assert hedger.stats.hedges == 0
+    hedger.close()
+
+
+def test_failover_and_all_failures():
+    hedger = Hedger(hedge_percentile=90)
+
+    def fail():
+        raise RuntimeError("down")
+
+    assert hedger.call("searxng", [fail, lambda: "mirror"]) == "mirror"
+    with pytest.raises(RuntimeError):
+        hedger.call("searxng", [fail, fail])
+    hedger.close()
+
+
+def test_disabled_hedger_runs_primary_only():
+    hedger = Hedger(hedge_percentile=None)
+    assert hedger.call("searxng", [lambda: "primary", lambda: "mirror"]) == "primary"
+
+
+def test_stragglers_do_not_block_later_queries(monkeypatch):
+    release = threading.Event()
+
+    def fake_fetch(engine, query, config, hedger=None, deadline=None):
+        if engine == "slow":
+            release.wait(5)
+        return [{"rank": 1, "url": f"https://{engine}.com"}]
+
+    monkeypatch.setattr(cli, "fetch_engine", fake_fetch)
+    config = load_config()
+    config.search.query_deadline_s = 0.2
+    hedger = Hedger(None)
+    try:
+        for query in ("a", "b", "c"):
+            results = cli.fetch_query(query, ["slow", "fast"], config, hedger)
+            assert results["slow"] is None
+            assert results["fast"]
+        assert hedger.stats.deadline_misses == 3
+    finally:
+        release.set()
+
+
+def test_request_timeout_is_capped_by_deadline():
+    config = load_config()
+    assert cli.request_timeout(config, None) == config.search.timeout_s
+    assert cli.request_timeout(config, time.perf_counter() + 0.5) <= 0.5
+    with pytest.raises(TimeoutError):
+        cli.request_timeout(config, time.perf_counter() - 1)
+
+
+def test_hedged_request_timeout_is_computed_when_it_starts(monkeypatch):
+    timeouts = {}
+
+    def fake_searx(query, base_url, timeout_s, user_agent, page=1):
+        timeouts[base_url] = timeout_s
+        if base_url == "http://primary":
+            time.sleep(0.3)
+        return [{"rank": 1, "url": f"{base_url}/result"}]
+
+    monkeypatch.setattr(cli.searxng, "fetch", fake_searx)
+    monkeypatch.delenv("SEARX_URL", raising=False)
+    config = load_config()
+    config.search.searx_url = "http://primary"
+    config.search.searx_mirrors = ["http://mirror"]
+    hedger = Hedger(50, min_samples=1)
+    hedger.tracker.record("searxng", 0.05)
+    try:
+        results = cli.fetch_engine("searxng", "q", config, hedger, time.perf_counter() + 2)
+    finally:
+        hedger.close()
+    assert results[0]["url"] == "http://mirror/result"
+    assert timeouts["http://mirror"] < timeouts["http://primary"] <= 2
+
+
+def test_no_hedging_without_mirrors(monkeypatch):
+    monkeypatch.delenv("SEARX_URL", raising=False)
+    config = load_config()
+    config.search.searx_mirrors = []
+    assert cli.searx_urls(config) == [config.search.searx_url]
+
+
+def test_hedger_rejects_out_of_range_percentile():
+    with pytest.raises(ValueError):
+        Hedger(150)
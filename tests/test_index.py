@@ -0,0 +1,71 @@
+from sandcastle.processor.index import InvertedIndex, build_index, decode_postings, encode_postings
+
+
+def sample_items():
+    return [
+        {
+            "id": "a",
+            "canonical_url": "https://a.com",
+            "title": "Anxiety journal",
+            "snippet": "printable pdf",
+            "cluster_ids": ["anxiety"],
+        },
+        {
+            "id": "b",
+            "canonical_url": "https://b.com",
+            "title": "Journal for anxiety",
+            "snippet": "prompts",
+            "cluster_ids": ["anxiety"],
+        },
+        {
+            "id": "c",
+            "canonical_url": "https://c.com",
+            "title": "Gratitude journal",
+            "snippet": "pdf",
+            "cluster_ids": ["gratitude"],
+        },
+    ]
+
+
+def test_postings_round_trip():
+    doc_ids = [0, 3, 4, 200, 100000]
+    assert decode_postings(encode_postings(doc_ids)) == doc_ids
+
+
+def test_term_and_phrase_queries(tmp_path):
+    build_index(sample_items(), tmp_path)
+    index = InvertedIndex(tmp_path)
+    assert index.search("journal") == [0, 1, 2]
+    assert index.search('"anxiety journal"') == [0]
+    assert index.doc(1)["id"] == "b"
+
+
+def test_boolean_and_cluster_queries(tmp_path):
+    build_index(sample_items(), tmp_path)
+    index = InvertedIndex(tmp_path)
+    assert index.search("journal -pdf") == [1]
+    assert index.search("prompts OR gratitude") == [1, 2]
+    assert index.search("pdf cluster:anxiety") == [0]
+    assert index.search("NOT cluster:anxiety") == [2]
+
+
+def test_missing_terms_and_empty_index(tmp_path):
+    build_index(sample_items(), tmp_path / "full")
+    index = InvertedIndex(tmp_path / "full")
+    assert index.search("zzz") == []
+    assert index.search("aaa OR journal") == [0, 1, 2]
+
+    build_index([], tmp_path / "empty")
+    assert InvertedIndex(tmp_path / "empty").search("journal") == []
+
+
+def test_long_phrase_requires_adjacent_tokens(tmp_path):
+    texts = [("anxiety journal kids", "journal pdf"), ("anxiety journal pdf", "prompts")]
+    items = [
+        {"id": str(idx), "canonical_url": f"https://{idx}.com", "title": title, "snippet": snippet}
+        for idx, (title, snippet) in enumerate(texts)
+    ]
+    build_index(items, tmp_path)
+    index = InvertedIndex(tmp_path)
+    assert index.search('"anxiety journal pdf"') == [1]
+    assert index.search('"anxiety journal"') == [0, 1]
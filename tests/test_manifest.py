@@ -0,0 +1,58 @@
+import json
+
+from click.testing import CliRunner
+
+from sandcastle.cli import main
+from sandcastle.manifest import Manifest, stage_digest
+
+
+def test_digest_tracks_file_contents_and_params(tmp_path):
+    path = tmp_path / "collector.jsonl"
+    path.write_text("a\n", encoding="utf-8")
+    first = stage_digest([path], {"threshold": 0.85})
+    assert stage_digest([path], {"threshold": 0.85}) == first
+    assert stage_digest([path], {"threshold": 0.9}) != first
+    path.write_text("b\n", encoding="utf-8")
+    assert stage_digest([path], {"threshold": 0.85}) != first
+
+
+def test_manifest_freshness_requires_outputs(tmp_path):
+    manifest = Manifest(tmp_path)
+    manifest.record("process", "abc", ["deduped.json"])
+    manifest.save()
+
+    reloaded = Manifest(tmp_path)
+    assert not reloaded.is_fresh("process", "abc")
+    (tmp_path / "deduped.json").write_text("[]", encoding="utf-8")
+    assert reloaded.is_fresh("process", "abc")
+    assert not reloaded.is_fresh("process", "other")
+    assert not reloaded.is_fresh("reason", "abc")
+
+
+def test_recluster_refuses_when_inputs_changed(tmp_path):
+    records = tmp_path / "collector.jsonl"
+    record = {
+        "query": "test",
+        "engine": "searxng",
+        "rank": 1,
+        "url": "https://a.com",
+        "title": "Anxiety journal",
+        "snippet": "Printable prompts",
+        "timestamp": "2026-02-06T10:30:00Z",
+    }
+    records.write_text(json.dumps(record) + "\n", encoding="utf-8")
+    keywords = tmp_path / "keywords.txt"
+    keywords.write_text("anxiety\n", encoding="utf-8")
+    out_dir = tmp_path / "out"
+    runner = CliRunner()
+    args = ["--outdir", str(out_dir), "--keywords", str(keywords)]
+    assert runner.invoke(main, ["process", "--in", str(records), *args]).exit_code == 0
+
+    keywords.write_text("anxiety\njournal\n", encoding="utf-8")
+    assert runner.invoke(main, ["recluster", *args]).exit_code == 0
+
+    with records.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({**record, "url": "https://b.com"}) + "\n")
+    result = runner.invoke(main, ["recluster", *args])
+    assert result.exit_code != 0
+    assert "run `sandcastle process`" in result.output
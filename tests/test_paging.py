@@ -0,0 +1,80 @@
+import pytest
+import yaml
+
+from sandcastle.collectors.paging import fetch_pages
+from sandcastle.config import DEFAULT_CONFIG_PATH, load_config, load_yaml
+
+
+def make_fetch(pages):
+    calls = []
+
+    def fetch_page(page):
+        calls.append(page)
+        return [{"rank": idx, "url": url} for idx, url in enumerate(pages.get(page, []), start=1)]
+
+    return fetch_page, calls
+
+
+def test_ranks_are_global_across_pages():
+    fetch_page, _ = make_fetch({1: ["https://a.com", "https://b.com"], 2: ["https://c.com"]})
+    results = fetch_pages(fetch_page, pages=2)
+    assert [(result["url"], result["rank"]) for result in results] == [
+        ("https://a.com", 1),
+        ("https://b.com", 2),
+        ("https://c.com", 3),
+    ]
+
+
+def test_stops_on_page_of_seen_urls():
+    fetch_page, calls = make_fetch(
+        {
+            1: ["https://a.com", "https://b.com"],
+            2: ["https://www.a.com", "http://b.com"],
+            3: ["https://c.com"],
+        }
+    )
+    results = fetch_pages(fetch_page, pages=5, prefetch=1)
+    assert [result["url"] for result in results] == ["https://a.com", "https://b.com"]
+    assert calls == [1, 2]
+
+
+def test_first_page_error_propagates():
+    def fetch_page(page):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        fetch_pages(fetch_page, pages=3)
+
+
+def test_deeper_pages_wait_for_new_first_page():
+    fetch_page, calls = make_fetch({1: [], 2: ["https://a.com"]})
+    assert fetch_pages(fetch_page, pages=4, prefetch=3) == []
+    assert calls == [1]
+
+
+def test_zero_prefetch_still_fetches_in_order():
+    fetch_page, calls = make_fetch({1: ["https://a.com"], 2: ["https://b.com"]})
+    assert [result["url"] for result in fetch_pages(fetch_page, pages=2, prefetch=0)] == [
+        "https://a.com",
+        "https://b.com",
+    ]
+    assert calls == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "override",
+    [
+        {"prefetch_pages": 0},
+        {"pages": {"brave": 0}},
+        {"hedge_percentile": 150},
+        {"hedge_percentile": 0},
+        {"hedge_min_samples": 0},
+    ],
+)
+def test_config_rejects_invalid_search_settings(tmp_path, override):
+    raw = load_yaml(DEFAULT_CONFIG_PATH)
+    raw["search"].update(override)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.safe_dump(raw), encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_config(config_path)
@@ -0,0 +1,89 @@
+import time
+
+import pytest
+
+from sandcastle.reasoner.backends import StubBackend
+from sandcastle.reasoner.executor import ReasonCache, run_reasoning
+
+
+def sample_clusters():
+    return [
+        {
+            "cluster_id": f"cluster_{idx}",
+            "label": f"cluster {idx}",
+            "member_ids": [str(idx)],
+            "count": 1,
+        }
+        for idx in range(5)
+    ]
+
+
+def test_results_preserve_cluster_order():
+    backend = StubBackend()
+    results, stats = run_reasoning(sample_clusters(), backend, max_workers=3, batch_size=2)
+    assert [result.cluster_id for result in results] == [f"cluster_{idx}" for idx in range(5)]
+    assert stats.batches == 3
+    assert backend.calls == 3
+
+
+def test_cache_skips_unchanged_clusters(tmp_path):
+    cache_path = tmp_path / "reason_cache.json"
+    clusters = sample_clusters()
+    cache = ReasonCache(cache_path)
+    run_reasoning(clusters, StubBackend(), cache=cache)
+    cache.save()
+
+    clusters[0]["count"] = 2
+    backend = StubBackend()
+    results, stats = run_reasoning(clusters, backend, cache=ReasonCache(cache_path), batch_size=10)
+    assert stats.cached == 4
+    assert backend.calls == 1
+    assert len(results) == 5
+
+
+class FlakyBackend(StubBackend):
+    def reason_batch(self, clusters):
+        if clusters[0]["cluster_id"] == "cluster_0":
+            raise RuntimeError("backend down")
+        return super().reason_batch(clusters)
+
+
+def test_cache_keeps_completed_batches_on_failure(tmp_path):
+    cache_path = tmp_path / "reason_cache.json"
+    with pytest.raises(RuntimeError):
+        run_reasoning(
+            sample_clusters(), FlakyBackend(), cache=ReasonCache(cache_path), batch_size=1
+        )
+    assert len(ReasonCache(cache_path).entries) == 4
+
+
+def test_cache_drops_removed_clusters(tmp_path):
+    cache_path = tmp_path / "reason_cache.json"
+    run_reasoning(sample_clusters(), StubBackend(), cache=ReasonCache(cache_path))
+    run_reasoning(sample_clusters()[:2], StubBackend(), cache=ReasonCache(cache_path))
+    assert len(ReasonCache(cache_path).entries) == 2
+
+
+class OtherBackend(StubBackend):
+    name = "other"
+
+
+def test_pruning_keeps_other_backends_entries(tmp_path):
+    cache_path = tmp_path / "reason_cache.json"
+    run_reasoning(sample_clusters(), OtherBackend(), cache=ReasonCache(cache_path))
+    run_reasoning(sample_clusters()[:2], StubBackend(), cache=ReasonCache(cache_path))
+    keys = ReasonCache(cache_path).entries
+    assert sum(key.startswith("other:") for key in keys) == 5
+    assert sum(key.startswith("stub:") for key in keys) == 2
+
+
+def test_concurrent_batches_beat_serial_latency():
+    clusters = sample_clusters()
+    started = time.perf_counter()
+    run_reasoning(clusters, StubBackend(latency_s=0.1), max_workers=1, batch_size=1)
+    serial = time.perf_counter() - started
+    started = time.perf_counter()
+    run_reasoning(clusters, StubBackend(latency_s=0.1), max_workers=5, batch_size=1)
+    concurrent = time.perf_counter() - started
+    assert serial >= 0.5
+    assert concurrent < serial / 2
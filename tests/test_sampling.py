@@ -0,0 +1,44 @@
+from sandcastle.processor.sampling import UrlHashSampler, estimate_count, occurrence_squares
+
+
+def records():
+    return [
+        {"query": f"q{idx % 3}", "engine": engine, "url": f"https://example.com/{idx}?utm_source=x"}
+        for idx in range(200)
+        for engine in ("searxng", "brave")
+    ]
+
+
+def test_sample_is_deterministic_and_keeps_url_sightings_together():
+    first = list(UrlHashSampler(0.25, seed=7).sample(records()))
+    second = list(UrlHashSampler(0.25, seed=7).sample(records()))
+    assert first == second
+    kept_urls = [record["url"] for record in first]
+    assert all(kept_urls.count(url) == 2 for url in kept_urls)
+    assert first != list(UrlHashSampler(0.25, seed=8).sample(records()))
+
+
+def test_report_tracks_query_engine_groups():
+    sampler = UrlHashSampler(0.5, seed=1)
+    kept = list(sampler.sample(records()))
+    report = sampler.report()
+    assert report["records_seen"] == 400
+    assert report["records_sampled"] == len(kept)
+    assert len(report["groups"]) == 6
+
+
+def test_estimate_scales_by_rate():
+    estimate = estimate_count(10, 0.1)
+    assert estimate["estimate"] == 100.0
+    assert estimate["ci95"] > 0
+    assert estimate_count(10, 1.0)["ci95"] == 0.0
+
+
+def test_repeated_occurrences_widen_term_interval():
+    items = [
+        {"title": "journal journal journal", "snippet": ""},
+        {"title": "journal", "snippet": ""},
+    ]
+    term_squares, _ = occurrence_squares(items)
+    assert term_squares["journal"] == 10
+    assert estimate_count(4, 0.1, term_squares["journal"])["ci95"] > estimate_count(4, 0.1)["ci95"]
@@ -0,0 +1,122 @@
+import json
+import threading
+import urllib.request
+from pathlib import Path
+
+from sandcastle.compact import url_id
+from sandcastle.processor.dedupe import dedupe_records, normalize_records
+from sandcastle.server import PipelineState, make_server
+
+
+def sample_record(url, rank=1):
+    return {
+        "query": "test",
+        "engine": "searxng",
+        "rank": rank,
+        "url": url,
+        "title": "Anxiety journal",
+        "snippet": "Printable prompts",
+        "timestamp": "2026-02-06T10:30:00Z",
+    }
+
+
+def make_state(tmp_path):
+    keywords_path = tmp_path / "keywords.txt"
+    keywords_path.write_text("anxiety\n", encoding="utf-8")
+    return PipelineState(None, None, keywords_path, out_path=tmp_path / "out")
+
+
+def test_snapshot_rebuilt_only_after_new_records(tmp_path):
+    state = make_state(tmp_path)
+    assert state.add_records([sample_record("https://a.com"), {"query": "missing fields"}]) == 1
+    assert len(state.snapshot().deduped) == 1
+    state.snapshot()
+    assert state.counters["builds"] == 1
+    assert state.counters["rejected"] == 1
+
+    state.add_records([sample_record("https://b.com/other")])
+    assert state.snapshot().clusters[0]["member_ids"]
+    assert state.counters["builds"] == 2
+
+
+def test_ingest_accepts_lenient_and_compact_records(tmp_path):
+    state = make_state(tmp_path)
+    bare = {
+        key: value
+        for key, value in sample_record("https://bare.com").items()
+        if key not in ("title", "snippet")
+    }
+    full = {**sample_record("https://a.com"), "url_id": url_id("https://a.com")}
+    ref = {
+        "ref": url_id("https://a.com"),
+        "query": "other",
+        "engine": "brave",
+        "rank": 3,
+        "timestamp": "2026-02-07T10:30:00Z",
+    }
+    assert state.add_records([bare, full]) == 2
+    assert state.add_records([ref, {"ref": "unknown", "query": "x"}]) == 1
+    assert state.counters["rejected"] == 1
+    merged = next(
+        item for item in state.snapshot().deduped if item["canonical_url"] == "https://a.com"
+    )
+    assert merged["engines"] == ["searxng", "brave"]
+
+
+def test_incremental_ingest_matches_batch_dedupe(tmp_path):
+    state = make_state(tmp_path)
+    records = [
+        sample_record("https://a.com", rank=4),
+        {**sample_record("https://b.com", rank=2), "title": "Unrelated planner"},
+        sample_record("https://c.com", rank=2),
+        sample_record("https://a.com", rank=1),
+    ]
+    for record in records:
+        state.add_records([record])
+    threshold = state.config.dedupe.similarity_threshold
+    assert state.dedupe.records() == dedupe_records(normalize_records(records), threshold)
+
+
+def test_concurrent_writes_leave_complete_outputs(tmp_path):
+    state = make_state(tmp_path)
+    state.add_records([sample_record(f"https://{idx}.com/page") for idx in range(50)])
+    threads = [
+        threading.Thread(target=state.write, kwargs={"build_search_index": True}) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert state.counters["writes"] == 4
+    out_path = tmp_path / "out"
+    assert len(json.loads((out_path / "deduped.json").read_text(encoding="utf-8"))) == 1
+    assert sorted(path.name for path in out_path.iterdir()) == [
+        "clusters.json",
+        "deduped.json",
+        "index",
+        "terms.json",
+    ]
+
+
+def test_http_ingest_and_process(tmp_path):
+    state = make_state(tmp_path)
+    server = make_server(state, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        body = json.dumps([sample_record("https://a.com")]).encode("utf-8")
+        with urllib.request.urlopen(
+            urllib.request.Request(f"{base}/records", data=body)
+        ) as response:
+            assert json.load(response) == {"accepted": 1, "rejected": 0}
+        with urllib.request.urlopen(f"{base}/clusters") as response:
+            assert json.load(response)[0]["cluster_id"] == "anxiety"
+        with urllib.request.urlopen(
+            urllib.request.Request(f"{base}/process", data=b"{}")
+        ) as response:
+            assert json.load(response)["outdir"] == str(tmp_path / "out")
+        assert Path(tmp_path / "out" / "terms.json").exists()
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -1,3 +1,7 @@
+import pytest
+import yaml
+
+from sandcastle.config import DEFAULT_CONFIG_PATH, load_config, load_yaml
 from sandcastle.processor.terms import aggregate_terms
 
 
@@ -29,3 +33,32 @@ def test_stopwords_filtered():
     top_terms = {term for term, _ in terms["global_top_terms"]}
     assert "the" not in top_terms
     assert "a" not in top_terms
+
+
+def test_streaming_matches_exact_counts():
+    items = [
+        {"title": "Anxiety journal", "snippet": "Printable anxiety prompts"},
+        {"title": "Gratitude journal", "snippet": "Printable pdf"},
+        {"title": "Anxiety workbook", "snippet": "anxiety journal prompts"},
+    ]
+    exact = aggregate_terms(items, limit=3)
+    streaming = aggregate_terms(items, limit=3, max_counters=100)
+    assert streaming["global_top_terms"] == exact["global_top_terms"]
+    assert streaming["global_top_bigrams"] == exact["global_top_bigrams"]
+    assert streaming["error_bounds"] == {"terms": 0, "bigrams": 0}
+
+
+def test_streaming_reports_error_bound_when_full():
+    items = [{"title": f"journal anxiety rare{idx}", "snippet": ""} for idx in range(20)]
+    terms = aggregate_terms(items, limit=2, max_counters=4)
+    assert dict(terms["global_top_terms"]) == {"anxiety": 20, "journal": 20}
+    assert terms["error_bounds"]["terms"] > 0
+
+
+def test_config_rejects_zero_max_counters(tmp_path):
+    raw = load_yaml(DEFAULT_CONFIG_PATH)
+    raw["terms"] = {"max_counters": 0}
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.safe_dump(raw), encoding="utf-8")
+    with pytest.raises(ValueError, match="max_counters"):
+        load_config(config_path)